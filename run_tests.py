@@ -4,6 +4,7 @@ Test runner for validating all test cases
 import json
 import sys
 import os
+import asyncio
 from pathlib import Path
 
 # Set UTF-8 encoding for Windows console
@@ -12,7 +13,7 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from src.models.pet_models import UserInput, Location
-from src.main import load_config, setup_agents, process_pet_report
+from src.main import configure_logging, load_config, setup_agents, process_pet_report_once
 
 def test_case(case_name: str, case_path: Path):
     """Run a single test case"""
@@ -59,8 +60,8 @@ def test_case(case_name: str, case_path: Path):
         config = load_config()
         agent1, agent2, agent3 = setup_agents(config)
         
-        # Process the report
-        result = process_pet_report(user_input, agent1, agent2, agent3)
+        # Process the report (closes this case's pooled clients when done)
+        result = asyncio.run(process_pet_report_once(user_input, agent1, agent2, agent3))
         
         if result:
             print(f"\n✓ {case_name} PASSED")
@@ -84,6 +85,7 @@ def test_case(case_name: str, case_path: Path):
 
 def main():
     """Run all test cases"""
+    configure_logging()
     print("\n" + "="*80)
     print("RUNNING ALL TEST CASES")
     print("="*80)
@@ -0,0 +1,51 @@
+"""
+Response cache for LLM calls made by the agents.
+Stores parsed model outputs keyed by a content hash so repeated reports
+(duplicates, retries, test runs) skip the API round-trip entirely.
+
+Backed by diskcache when installed and the directory is usable (opened on
+first use), otherwise by a bounded in-process LRU.
+"""
+
+import os
+from typing import Any, Optional
+
+from src.utils._cache_store import CacheStore
+
+# Default time-to-live for cached responses: 7 days
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Entries kept when falling back to memory
+MEMORY_MAX_ENTRIES = 1024
+
+CACHE_DIR = os.getenv('LLM_CACHE_DIR', './data/llm_cache')
+
+_store = CacheStore(CACHE_DIR, memory_max_entries=MEMORY_MAX_ENTRIES)
+
+
+def get(key: str) -> Optional[Any]:
+    """
+    Get a cached value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached value, or None if missing or expired
+    """
+    return _store.get(key)
+
+
+def set(key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """
+    Store a value in the cache.
+
+    Args:
+        key: Cache key
+        value: Value to store (must be picklable for the disk backend)
+        ttl: Time-to-live in seconds
+    """
+    _store.set(key, value, expire=ttl)
+
+
+__all__ = ['get', 'set', 'DEFAULT_TTL_SECONDS']
@@ -19,7 +19,8 @@ class DecisionExplanationAgent:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model: str = "gpt-4o"
+        model: str = "gpt-4o",
+        client: Optional[OpenAI] = None
     ):
         """
         Initialize the Decision & Explanation Agent.
@@ -27,12 +28,13 @@ class DecisionExplanationAgent:
         Args:
             api_key: OpenAI API key
             model: Model for generating explanations
+            client: Shared OpenAI client (created if not provided)
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OpenAI API key not found")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = client or OpenAI(api_key=self.api_key)
         self.model = model
     
     def should_notify_user(self, match: MatchCandidate) -> bool:
@@ -4,13 +4,35 @@ Searches for similar pets using embeddings and similarity scoring.
 """
 
 import os
+import heapq
 import hashlib
+from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 from datetime import datetime
+from pydantic import TypeAdapter
+from openai import OpenAI
 from src.models.pet_models import PetDescription, PetReport
 from src.models.match_models import MatchCandidate, MatchResult, ConfidenceLevel
 from src.utils.data_access import get_mock_database, MockDatabase
-from src.utils.embedding_utils import create_pet_embedding, cosine_similarity
+from src.utils.embedding_utils import create_pet_embedding, cosine_similarity_batch
+
+
+@dataclass(slots=True, frozen=True)
+class _MatchCandidateInternal:
+    """Unvalidated match candidate built during a search (same fields as MatchCandidate)."""
+    match_id: str
+    report_type: str
+    similarity_score: float
+    matching_reasons: List[str] = field(default_factory=list)
+    location_distance_km: Optional[float] = None
+    days_since_report: Optional[int] = None
+    pet_name: Optional[str] = None
+    contact_available: bool = False
+    view_url: Optional[str] = None
+
+
+# Validates a whole search's candidates in one call
+_MATCH_CANDIDATES = TypeAdapter(List[MatchCandidate])
 
 
 class MatchSimilarityAgent:
@@ -23,7 +45,8 @@ class MatchSimilarityAgent:
         api_key: Optional[str] = None,
         use_embeddings: bool = True,
         top_k: int = 5,
-        similarity_threshold: float = 0.6
+        similarity_threshold: float = 0.6,
+        client: Optional[OpenAI] = None
     ):
         """
         Initialize the Match & Similarity Agent.
@@ -33,11 +56,13 @@ class MatchSimilarityAgent:
             use_embeddings: Whether to use real embeddings (requires API) or mock similarity
             top_k: Maximum number of matches to return
             similarity_threshold: Minimum similarity score for matches
+            client: Shared OpenAI client for embeddings (cached per API key if not provided)
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         self.use_embeddings = use_embeddings and self.api_key is not None
         self.top_k = top_k
         self.similarity_threshold = similarity_threshold
+        self.client = client
         self.db = get_mock_database()
     
     def generate_embedding(self, pet_data: PetDescription) -> Optional[List[float]]:
@@ -54,7 +79,7 @@ class MatchSimilarityAgent:
             return None
         
         try:
-            embedding = create_pet_embedding(pet_data, api_key=self.api_key)
+            embedding = create_pet_embedding(pet_data, api_key=self.api_key, client=self.client)
             return embedding
         except Exception as e:
             print(f"  Warning: Failed to create embedding: {e}")
@@ -82,32 +107,39 @@ class MatchSimilarityAgent:
         if report_type is None or report_type == 'sighting':
             reports.extend(self.db.get_all_sightings())
         
-        # Calculate similarity for each report
-        scored_reports = []
+        # Generate an embedding for each report
+        embedded_reports = []
+        report_embeddings = []
         for report in reports:
-            # Generate embedding for this report
             try:
-                report_embedding = create_pet_embedding(
+                report_embeddings.append(create_pet_embedding(
                     report.pet_description,
-                    api_key=self.api_key
-                )
-                
-                # Calculate cosine similarity
-                similarity = cosine_similarity(query_embedding, report_embedding)
-                
-                # Convert from [-1, 1] to [0, 1] range
-                normalized_similarity = (similarity + 1) / 2
-                
-                scored_reports.append((report, normalized_similarity))
-                
+                    api_key=self.api_key,
+                    client=self.client
+                ))
+                embedded_reports.append(report)
             except Exception as e:
                 print(f"  Warning: Failed to score {report.report_id}: {e}")
                 continue
         
-        # Sort by similarity (highest first)
-        scored_reports.sort(key=lambda x: x[1], reverse=True)
+        if not embedded_reports:
+            return []
         
-        return scored_reports[:self.top_k]
+        # Calculate cosine similarity against all reports in one matrix product
+        try:
+            similarities = cosine_similarity_batch(query_embedding, report_embeddings)
+        except ValueError as e:
+            print(f"  Warning: Failed to score reports: {e}")
+            return []
+        
+        # Convert from [-1, 1] to [0, 1] range
+        scored_reports = [
+            (report, (float(similarity) + 1) / 2)
+            for report, similarity in zip(embedded_reports, similarities)
+        ]
+        
+        # Top matches by similarity (highest first) without a full sort
+        return heapq.nlargest(self.top_k, scored_reports, key=lambda x: x[1])
     
     def search_with_mock(
         self,
@@ -185,7 +217,8 @@ class MatchSimilarityAgent:
         self,
         report: PetReport,
         similarity_score: float,
-        query_pet: PetDescription
+        query_pet: PetDescription,
+        now: Optional[datetime] = None
     ) -> MatchCandidate:
         """
         Create a MatchCandidate from a report and similarity score.
@@ -194,10 +227,24 @@ class MatchSimilarityAgent:
             report: Pet report from database
             similarity_score: Calculated similarity
             query_pet: Original query pet
+            now: Current time shared across the candidates of one search
             
         Returns:
             MatchCandidate object
         """
+        return MatchCandidate.model_validate(
+            self._build_candidate(report, similarity_score, query_pet, now),
+            from_attributes=True
+        )
+    
+    def _build_candidate(
+        self,
+        report: PetReport,
+        similarity_score: float,
+        query_pet: PetDescription,
+        now: Optional[datetime] = None
+    ) -> _MatchCandidateInternal:
+        """Gather a candidate's fields without Pydantic validation (see create_match_candidate)."""
         # Calculate matching reasons
         reasons = self.calculate_matching_reasons(query_pet, report.pet_description)
         
@@ -208,12 +255,12 @@ class MatchSimilarityAgent:
         )
         
         # Calculate days since report
-        days_since = self.db.calculate_days_since(report.report_date)
+        days_since = self.db.calculate_days_since(report.report_date, now)
         
         # Generate fake URL for viewing the report
         view_url = self.generate_view_url(report.report_id)
         
-        return MatchCandidate(
+        return _MatchCandidateInternal(
             match_id=report.report_id,
             report_type=report.report_type,
             similarity_score=similarity_score,
@@ -296,11 +343,15 @@ class MatchSimilarityAgent:
         print(f"  - Found {len(scored_reports)} potential matches")
         
         # Filter by threshold and create candidates
-        candidates = []
-        for report, score in scored_reports:
-            if score >= self.similarity_threshold:
-                candidate = self.create_match_candidate(report, score, pet_description)
-                candidates.append(candidate)
+        now = datetime.now()
+        candidates = _MATCH_CANDIDATES.validate_python(
+            [
+                self._build_candidate(report, score, pet_description, now)
+                for report, score in scored_reports
+                if score >= self.similarity_threshold
+            ],
+            from_attributes=True
+        )
         
         print(f"  - {len(candidates)} matches above threshold ({self.similarity_threshold})")
         
@@ -316,7 +367,7 @@ class MatchSimilarityAgent:
             top_match=top_match,
             confidence_level=confidence,
             total_candidates_found=len(scored_reports),
-            search_timestamp=datetime.now().isoformat()
+            search_timestamp=now.isoformat()
         )
         
         print(f"[Agent 2] ✓ Search complete!")
@@ -4,12 +4,101 @@ Processes multimodal inputs (images + text) to extract structured pet descriptio
 """
 
 import os
+import asyncio
+import hashlib
+import logging
 from typing import List, Dict, Optional
-from openai import OpenAI
-from src.models.pet_models import PetDescription, Location, UserInput
-from src.utils.image_utils import process_multiple_images, validate_image_format
+import openai
+from openai import AsyncOpenAI
+from tenacity import retry, retry_if_exception_type, wait_exponential_jitter, stop_after_attempt
+from src.models.pet_models import PetDescription, Location, UserInput, PetVisualSchema, PetTextSchema
+from src.utils.image_utils import process_single_image, process_single_image_bytes, LOW_DETAIL_SIZE
+from src.agents import _llm_cache as llm_cache
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# Bump whenever the extraction prompts change so cached responses are invalidated
+PROMPT_VERSION = "v2"
+
+# Transient API errors worth retrying with backoff
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError
+)
+
+# Errors that degrade to an empty extraction instead of failing the report:
+# rejected requests, unusable input/output, and retryable errors after the last attempt
+_FALLBACK_ERRORS = (openai.BadRequestError, ValueError) + _RETRYABLE_ERRORS
+
+# Structured output formats: the API guarantees responses match these schemas
+_VISUAL_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "pet_visual",
+        "schema": PetVisualSchema.model_json_schema(),
+        "strict": True
+    }
+}
+_TEXT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "pet_text",
+        "schema": PetTextSchema.model_json_schema(),
+        "strict": True
+    }
+}
+
+
+# Fallback extraction when analysis is skipped or fails (tuples keep the template immutable)
+_EMPTY_EXTRACT = {
+    "species": None,
+    "size": None,
+    "colors": (),
+    "distinctive_features": (),
+    "breed": None,
+    "approximate_age": None
+}
+
+
+def _empty_extract() -> Dict:
+    """Return a fresh copy of the empty extraction result."""
+    return {**_EMPTY_EXTRACT, "colors": [], "distinctive_features": []}
+
+
+def _response_text(response) -> str:
+    """
+    Return the text of a chat completion.
+    
+    Raises:
+        ValueError: If the model refused or returned no content (strict
+            structured outputs report refusals with content=None)
+    """
+    message = response.choices[0].message
+    refusal = getattr(message, 'refusal', None)
+    if refusal:
+        raise ValueError(f"Model refused the request: {refusal}")
+    if message.content is None:
+        raise ValueError("Model returned no content")
+    return message.content
+
+
+def _loads(text: str) -> Dict:
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 
 class VisualTextExtractorAgent:
     """
@@ -21,7 +110,11 @@ class VisualTextExtractorAgent:
         self, 
         api_key: Optional[str] = None,
         vision_model: str = "gpt-4o",
-        text_model: str = "gpt-4o"
+        text_model: str = "gpt-4o",
+        async_client: Optional[AsyncOpenAI] = None,
+        max_images_per_call: int = 3,
+        vision_max_tokens: int = 500,
+        vision_temperature: float = 0.2
     ):
         """
         Initialize the Visual & Text Extractor Agent.
@@ -30,38 +123,50 @@ class VisualTextExtractorAgent:
             api_key: OpenAI API key (uses env var if not provided)
             vision_model: Model for image analysis
             text_model: Model for text processing
+            async_client: Shared AsyncOpenAI client (created if not provided)
+            max_images_per_call: Maximum images sent to the vision model per report
+            vision_max_tokens: Token budget for the vision response
+            vision_temperature: Sampling temperature for image analysis
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        # SDK retries disabled: _call_llm owns the retry policy
+        self.async_client = async_client or AsyncOpenAI(api_key=self.api_key, max_retries=0)
         self.vision_model = vision_model
         self.text_model = text_model
+        self.max_images_per_call = max_images_per_call
+        self.vision_max_tokens = vision_max_tokens
+        self.vision_temperature = vision_temperature
     
-    def analyze_images(self, image_paths: List[str]) -> Dict:
+    async def analyze_images(
+        self,
+        image_paths: List[str],
+        image_bytes: Optional[List[bytes]] = None
+    ) -> Dict:
         """
         Analyze pet images using GPT-4 Vision to extract visual features.
         
         Args:
             image_paths: List of paths to pet images
+            image_bytes: Optional in-memory image contents (encoded without touching disk)
             
         Returns:
             Dictionary with extracted visual features
         """
-        if not image_paths:
-            return {
-                "species": None,
-                "size": None,
-                "colors": [],
-                "distinctive_features": [],
-                "breed": None,
-                "approximate_age": None
-            }
+        if not image_paths and not image_bytes:
+            return _empty_extract()
         
         try:
-            # Process images (validate and encode)
-            processed_images = process_multiple_images(image_paths, validate=True)
+            # Process images (validate, downscale to low-detail resolution and encode)
+            # in worker threads so the event loop keeps serving other requests
+            processed_images = await asyncio.gather(
+                *(asyncio.to_thread(process_single_image, path, True, LOW_DETAIL_SIZE)
+                  for path in image_paths),
+                *(asyncio.to_thread(process_single_image_bytes, data, True, LOW_DETAIL_SIZE)
+                  for data in image_bytes or ())
+            )
             
             # Filter valid images
             valid_images = [img for img in processed_images if img['valid']]
@@ -69,6 +174,17 @@ class VisualTextExtractorAgent:
             if not valid_images:
                 raise ValueError("No valid images found")
             
+            # Return cached analysis for identical images and generation settings
+            cache_key = self._cache_key(
+                *(img['base64'] for img in valid_images[:self.max_images_per_call]),
+                self.vision_model,
+                str(self.vision_max_tokens),
+                str(self.vision_temperature)
+            )
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             # Build messages for vision API
             content = [{
                 "type": "text",
@@ -82,50 +198,45 @@ class VisualTextExtractorAgent:
   "approximate_age": "puppy|young adult|adult|senior or null if unknown"
 }
 
-Be specific about distinctive features like: collar color, ear shape, markings, scars, tail characteristics, eye color, etc.
-Provide only the JSON, no additional text."""
+Be specific about distinctive features like: collar color, ear shape, markings, scars, tail characteristics, eye color, etc."""
             }]
             
-            # Add images
-            for img in valid_images[:3]:  # Limit to 3 images to control costs
+            # Add images (capped to control costs)
+            for img in valid_images[:self.max_images_per_call]:
                 content.append({
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/jpeg;base64,{img['base64']}"
+                        "url": f"data:image/jpeg;base64,{img['base64']}",
+                        "detail": "low"
                     }
                 })
             
             # Call vision API
-            response = self.client.chat.completions.create(
+            response = await self._call_llm(
                 model=self.vision_model,
                 messages=[{
                     "role": "user",
                     "content": content
                 }],
-                max_tokens=500,
-                temperature=0.2
+                max_tokens=self.vision_max_tokens,
+                temperature=self.vision_temperature,
+                response_format=_VISUAL_RESPONSE_FORMAT
             )
             
             # Parse response
-            result_text = response.choices[0].message.content
+            result_text = _response_text(response)
             
             # Extract JSON from response
             result = self._extract_json(result_text)
+            llm_cache.set(cache_key, result)
             
             return result
             
-        except Exception as e:
-            print(f"Error analyzing images: {e}")
-            return {
-                "species": None,
-                "size": None,
-                "colors": [],
-                "distinctive_features": [],
-                "breed": None,
-                "approximate_age": None
-            }
+        except _FALLBACK_ERRORS as e:
+            log.warning("Error analyzing images: %s", e)
+            return _empty_extract()
     
-    def analyze_text(self, description: str, location: Location) -> Dict:
+    async def analyze_text(self, description: str, location: Location) -> Dict:
         """
         Analyze user text description to extract pet information.
         
@@ -137,6 +248,18 @@ Provide only the JSON, no additional text."""
             Dictionary with extracted text features
         """
         try:
+            # Return cached analysis for an identical description and location
+            cache_key = self._cache_key(
+                description,
+                location.province,
+                location.canton,
+                location.district,
+                self.text_model
+            )
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             prompt = f"""Analyze this pet description and extract information in JSON format:
 
 Description: "{description}"
@@ -153,33 +276,28 @@ Extract:
   "additional_context": "any other relevant information"
 }}
 
-Be conservative - only extract information explicitly mentioned. Return only JSON."""
+Be conservative - only extract information explicitly mentioned."""
             
-            response = self.client.chat.completions.create(
+            response = await self._call_llm(
                 model=self.text_model,
                 messages=[
-                    {"role": "system", "content": "You are a precise information extractor. Output only valid JSON."},
+                    {"role": "system", "content": "You are a precise information extractor."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=400,
-                temperature=0.1
+                temperature=0.1,
+                response_format=_TEXT_RESPONSE_FORMAT
             )
             
-            result_text = response.choices[0].message.content
+            result_text = _response_text(response)
             result = self._extract_json(result_text)
+            llm_cache.set(cache_key, result)
             
             return result
             
-        except Exception as e:
-            print(f"Error analyzing text: {e}")
-            return {
-                "species": None,
-                "size": None,
-                "colors": [],
-                "distinctive_features": [],
-                "breed": None,
-                "approximate_age": None
-            }
+        except _FALLBACK_ERRORS as e:
+            log.warning("Error analyzing text: %s", e)
+            return _empty_extract()
     
     def merge_and_validate(
         self, 
@@ -201,30 +319,26 @@ Be conservative - only extract information explicitly mentioned. Return only JSO
             Validated PetDescription model
         """
         # Merge data, preferring image data for visual features
-        merged = {
-            "species": image_data.get("species") or text_data.get("species") or "other",
-            "size": image_data.get("size") or text_data.get("size") or "medium",
-            "colors": self._merge_lists(image_data.get("colors", []), text_data.get("colors", [])),
-            "distinctive_features": self._merge_lists(
-                image_data.get("distinctive_features", []), 
-                text_data.get("distinctive_features", [])
-            ),
-            "breed": image_data.get("breed") or text_data.get("breed"),
-            "approximate_age": image_data.get("approximate_age") or text_data.get("approximate_age"),
-            "last_seen_location": location,
-            "last_seen_date": last_seen_date
-        }
+        colors = self._merge_lists(image_data.get("colors", []), text_data.get("colors", []))
         
-        # Ensure at least one color
-        if not merged["colors"]:
-            merged["colors"] = ["unknown"]
-        
-        # Create validated model
+        # Build the validated model directly from the merged fields
         try:
-            pet_description = PetDescription(**merged)
-            return pet_description
+            return PetDescription(
+                species=image_data.get("species") or text_data.get("species") or "other",
+                size=image_data.get("size") or text_data.get("size") or "medium",
+                # Ensure at least one color
+                colors=colors or ["unknown"],
+                distinctive_features=self._merge_lists(
+                    image_data.get("distinctive_features", []),
+                    text_data.get("distinctive_features", [])
+                ),
+                breed=image_data.get("breed") or text_data.get("breed"),
+                approximate_age=image_data.get("approximate_age") or text_data.get("approximate_age"),
+                last_seen_location=location,
+                last_seen_date=last_seen_date
+            )
         except Exception as e:
-            print(f"Validation error: {e}")
+            log.warning("Validation error: %s", e)
             # Retry with minimal valid data
             minimal = {
                 "species": "other",
@@ -234,7 +348,7 @@ Be conservative - only extract information explicitly mentioned. Return only JSO
             }
             return PetDescription(**minimal)
     
-    def process(self, user_input: UserInput) -> PetDescription:
+    async def process(self, user_input: UserInput) -> PetDescription:
         """
         Main processing method - orchestrates the full extraction pipeline.
         
@@ -244,60 +358,65 @@ Be conservative - only extract information explicitly mentioned. Return only JSO
         Returns:
             Structured and validated PetDescription
         """
-        print("\n[Agent 1: Visual & Text Extractor] Starting extraction...")
-        
-        # Step 1: Analyze images
-        print(f"  - Analyzing {len(user_input.images)} images...")
-        image_data = self.analyze_images(user_input.images)
-        print(f"  - Image analysis complete: {image_data.get('species')}, {image_data.get('size')}")
+        log.info("[Agent 1: Visual & Text Extractor] Starting extraction...")
         
-        # Step 2: Analyze text
-        print(f"  - Analyzing text description...")
-        text_data = self.analyze_text(user_input.description, user_input.location)
-        print(f"  - Text analysis complete")
+        # Steps 1 & 2: Analyze images and text concurrently (independent API calls)
+        log.debug("Analyzing %d images and text description...", user_input.image_count)
+        image_data, text_data = await asyncio.gather(
+            self.analyze_images(user_input.images, user_input.image_bytes),
+            self.analyze_text(user_input.description, user_input.location)
+        )
+        log.debug("Image analysis complete: %s, %s", image_data.get('species'), image_data.get('size'))
+        log.debug("Text analysis complete")
         
         # Step 3: Merge and validate
-        print(f"  - Merging and validating data...")
+        log.debug("Merging and validating data...")
         pet_description = self.merge_and_validate(
             image_data, 
             text_data, 
             user_input.location
         )
         
-        print(f"[Agent 1] ✓ Extraction complete!")
-        print(f"  Result: {pet_description.species} | {pet_description.size} | Colors: {pet_description.colors}")
-        print(f"  Features: {pet_description.distinctive_features}")
+        log.info(
+            "[Agent 1] Extraction complete: %s | %s | Colors: %s | Features: %s",
+            pet_description.species.value,
+            pet_description.size.value,
+            pet_description.colors,
+            pet_description.distinctive_features
+        )
         
         return pet_description
     
+    @retry(
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(3),
+        reraise=True
+    )
+    async def _call_llm(self, **kwargs):
+        """Call the chat completions API, retrying transient failures with exponential backoff."""
+        return await self.async_client.chat.completions.create(**kwargs)
+    
+    def _cache_key(self, *parts: str) -> str:
+        """Build a content-hash cache key from prompt inputs, model and prompt version."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\x00')
+        digest.update(PROMPT_VERSION.encode('utf-8'))
+        return digest.hexdigest()
+    
     def _extract_json(self, text: str) -> Dict:
-        """Extract JSON from text that may contain markdown or other formatting."""
-        try:
-            # Try direct parsing first
-            return json.loads(text)
-        except:
-            # Try to find JSON in markdown code blocks
-            import re
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
-            
-            # Try to find any JSON object
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(0))
-            
-            raise ValueError("No valid JSON found in response")
+        """Parse a structured-output response (always valid JSON)."""
+        return _loads(text)
     
     def _merge_lists(self, list1: List[str], list2: List[str]) -> List[str]:
-        """Merge two lists, removing duplicates while preserving order."""
-        seen = set()
-        result = []
-        for item in list1 + list2:
-            if item and item.lower() not in seen:
-                seen.add(item.lower())
-                result.append(item)
-        return result
+        """Merge two lists, removing case-insensitive duplicates while preserving order."""
+        seen = {}
+        for item in (*list1, *list2):
+            if item:
+                seen.setdefault(item.lower(), item)
+        return list(seen.values())
 
 
 # Export
@@ -4,10 +4,10 @@ FastAPI REST API for AI Multi-Agent Lost Pet Intelligence System
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional
-import os
-import tempfile
+import logging
+import orjson
 from pathlib import Path
 import sys
 
@@ -15,7 +15,16 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.models.pet_models import UserInput, Location
-from src.main import load_config, setup_agents, process_pet_report
+from src.main import (
+    configure_logging,
+    load_config,
+    setup_agents,
+    process_pet_report,
+    process_pet_report_stream,
+    close_shared_clients
+)
+
+log = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -23,7 +32,8 @@ app = FastAPI(
     description="AI-powered multi-agent system for matching lost pets and sightings",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -39,16 +49,27 @@ app.add_middleware(
 agents = None
 config = None
 
+# Upload limits
+MAX_UPLOAD_BYTES = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize agents when API starts"""
     global agents, config
-    print("🚀 Starting Lost Pet Intelligence API...")
+    configure_logging()
+    log.info("Starting Lost Pet Intelligence API...")
     config = load_config()
     agent1, agent2, agent3 = setup_agents(config)
     agents = (agent1, agent2, agent3)
-    print("✅ All agents initialized successfully!")
+    log.info("All agents initialized successfully!")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled HTTP connections when API stops"""
+    await close_shared_clients()
 
 
 @app.get("/")
@@ -61,6 +82,8 @@ async def root():
         "endpoints": {
             "lost_report": "/api/v1/report/lost",
             "sighting_report": "/api/v1/report/sighting",
+            "lost_report_stream": "/api/v1/report/lost/stream",
+            "sighting_report_stream": "/api/v1/report/sighting/stream",
             "search": "/api/v1/search",
             "docs": "/docs"
         }
@@ -77,88 +100,95 @@ async def health_check():
     }
 
 
-@app.post("/api/v1/report/lost")
-async def report_lost_pet(
-    province: str = Form(..., description="Province in Costa Rica"),
-    canton: str = Form(..., description="Canton"),
-    district: str = Form(..., description="District"),
-    description: str = Form(..., min_length=10, description="Pet description (min 10 characters)"),
-    additional_details: Optional[str] = Form(None, description="Additional location details"),
-    images: List[UploadFile] = File(default=[], description="Pet images (max 5)")
-):
+async def _read_upload(image: UploadFile, max_bytes: int) -> bytes:
     """
-    Report a lost pet
+    Read an uploaded file into memory in fixed-size chunks.
     
-    - **province**: One of the 7 Costa Rica provinces
-    - **canton**: Canton name
-    - **district**: District name
-    - **description**: Detailed description of the lost pet
-    - **additional_details**: Optional additional location info
-    - **images**: Optional images (JPEG, PNG, GIF, BMP, WebP, max 5MB each)
+    Rejects the file as soon as it exceeds max_bytes, before the rest of
+    the body is buffered.
     """
-    try:
-        # Validate number of images
-        if len(images) > 5:
+    contents = bytearray()
+    while chunk := await image.read(UPLOAD_CHUNK_SIZE):
+        contents += chunk
+        if len(contents) > max_bytes:
             raise HTTPException(
                 status_code=400,
-                detail="Maximum 5 images allowed"
+                detail=f"Image {image.filename} exceeds {max_bytes // (1024 * 1024)}MB limit"
             )
-        
-        # Process uploaded images
-        image_paths = []
-        temp_dir = tempfile.mkdtemp()
-        
-        for idx, image in enumerate(images):
-            if image.filename:
-                # Validate file size (5MB max)
-                contents = await image.read()
-                if len(contents) > 5 * 1024 * 1024:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Image {image.filename} exceeds 5MB limit"
-                    )
-                
-                # Save temporarily
-                temp_path = Path(temp_dir) / f"upload_{idx}_{image.filename}"
-                with open(temp_path, 'wb') as f:
-                    f.write(contents)
-                image_paths.append(str(temp_path))
-        
-        # Create Location object
-        location = Location(
-            province=province,
-            canton=canton,
-            district=district,
-            additional_details=additional_details
+    return bytes(contents)
+
+
+async def _build_user_input(
+    report_type: str,
+    province: str,
+    canton: str,
+    district: str,
+    description: str,
+    additional_details: Optional[str],
+    images: List[UploadFile]
+) -> UserInput:
+    """
+    Validate the form fields and uploads of a report request.
+    
+    Uploaded images are kept in memory and passed to the agents as bytes.
+    """
+    # Text-only forms may still carry empty, unnamed file parts
+    uploads = [image for image in images if image.filename]
+    
+    # Validate number of images
+    if len(uploads) > 5:
+        raise HTTPException(
+            status_code=400,
+            detail="Maximum 5 images allowed"
         )
-        
-        # Create UserInput object
-        user_input = UserInput(
-            report_type="lost",
-            location=location,
-            description=description,
-            images=image_paths
+    
+    # Read uploaded images (validates 5MB max while reading)
+    image_bytes_list = [await _read_upload(image, MAX_UPLOAD_BYTES) for image in uploads]
+    
+    # Create Location object
+    location = Location(
+        province=province,
+        canton=canton,
+        district=district,
+        additional_details=additional_details
+    )
+    
+    # Create UserInput object
+    return UserInput.from_bytes(
+        image_bytes_list,
+        report_type=report_type,
+        location=location,
+        description=description
+    )
+
+
+async def _handle_report(
+    report_type: str,
+    province: str,
+    canton: str,
+    district: str,
+    description: str,
+    additional_details: Optional[str],
+    images: List[UploadFile]
+) -> ORJSONResponse:
+    """Shared implementation for the lost pet and sighting endpoints."""
+    try:
+        user_input = await _build_user_input(
+            report_type, province, canton, district, description,
+            additional_details, images
         )
         
         # Process through agents
         if agents is None:
             raise HTTPException(status_code=503, detail="Agents not initialized")
         
-        result = process_pet_report(user_input, *agents)
-        
-        # Clean up temp files
-        for path in image_paths:
-            try:
-                os.remove(path)
-            except:
-                pass
+        result = await process_pet_report(user_input, *agents)
         
         # Return result
-        return JSONResponse(
-            status_code=200,
+        return ORJSONResponse(
             content={
                 "success": True,
-                "result": result.dict() if hasattr(result, 'dict') else result.model_dump()
+                "result": result.model_dump(mode="json")
             }
         )
         
@@ -168,6 +198,71 @@ async def report_lost_pet(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _stream_report(
+    report_type: str,
+    province: str,
+    canton: str,
+    district: str,
+    description: str,
+    additional_details: Optional[str],
+    images: List[UploadFile]
+) -> StreamingResponse:
+    """
+    Shared implementation for the streaming endpoints.
+    
+    Sends one Server-Sent Event per agent result ("extraction", "matches",
+    "final") so clients can render the pet profile before matching finishes.
+    """
+    try:
+        user_input = await _build_user_input(
+            report_type, province, canton, district, description,
+            additional_details, images
+        )
+        
+        if agents is None:
+            raise HTTPException(status_code=503, detail="Agents not initialized")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def event_stream():
+        try:
+            async for event, payload in process_pet_report_stream(user_input, *agents):
+                data = {"event": event, "data": payload.model_dump(mode="json")}
+                yield b"data: " + orjson.dumps(data) + b"\n\n"
+        except Exception as e:
+            yield b"data: " + orjson.dumps({"event": "error", "detail": str(e)}) + b"\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@app.post("/api/v1/report/lost")
+async def report_lost_pet(
+    province: str = Form(..., description="Province in Costa Rica"),
+    canton: str = Form(..., description="Canton"),
+    district: str = Form(..., description="District"),
+    description: str = Form(..., min_length=10, description="Pet description (min 10 characters)"),
+    additional_details: Optional[str] = Form(None, description="Additional location details"),
+    images: List[UploadFile] = File(default=[], description="Pet images (max 5)")
+):
+    """
+    Report a lost pet
+    
+    - **province**: One of the 7 Costa Rica provinces
+    - **canton**: Canton name
+    - **district**: District name
+    - **description**: Detailed description of the lost pet
+    - **additional_details**: Optional additional location info
+    - **images**: Optional images (JPEG, PNG, GIF, BMP, WebP, max 5MB each)
+    """
+    return await _handle_report(
+        "lost", province, canton, district, description,
+        additional_details, images
+    )
+
+
 @app.post("/api/v1/report/sighting")
 async def report_sighting(
     province: str = Form(..., description="Province in Costa Rica"),
@@ -187,76 +282,52 @@ async def report_sighting(
     - **additional_details**: Optional additional location info
     - **images**: Optional images (JPEG, PNG, GIF, BMP, WebP, max 5MB each)
     """
-    try:
-        # Validate number of images
-        if len(images) > 5:
-            raise HTTPException(
-                status_code=400,
-                detail="Maximum 5 images allowed"
-            )
-        
-        # Process uploaded images
-        image_paths = []
-        temp_dir = tempfile.mkdtemp()
-        
-        for idx, image in enumerate(images):
-            if image.filename:
-                # Validate file size (5MB max)
-                contents = await image.read()
-                if len(contents) > 5 * 1024 * 1024:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Image {image.filename} exceeds 5MB limit"
-                    )
-                
-                # Save temporarily
-                temp_path = Path(temp_dir) / f"upload_{idx}_{image.filename}"
-                with open(temp_path, 'wb') as f:
-                    f.write(contents)
-                image_paths.append(str(temp_path))
-        
-        # Create Location object
-        location = Location(
-            province=province,
-            canton=canton,
-            district=district,
-            additional_details=additional_details
-        )
-        
-        # Create UserInput object
-        user_input = UserInput(
-            report_type="sighting",
-            location=location,
-            description=description,
-            images=image_paths
-        )
-        
-        # Process through agents
-        if agents is None:
-            raise HTTPException(status_code=503, detail="Agents not initialized")
-        
-        result = process_pet_report(user_input, *agents)
-        
-        # Clean up temp files
-        for path in image_paths:
-            try:
-                os.remove(path)
-            except:
-                pass
-        
-        # Return result
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "result": result.dict() if hasattr(result, 'dict') else result.model_dump()
-            }
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _handle_report(
+        "sighting", province, canton, district, description,
+        additional_details, images
+    )
+
+
+@app.post("/api/v1/report/lost/stream")
+async def report_lost_pet_stream(
+    province: str = Form(..., description="Province in Costa Rica"),
+    canton: str = Form(..., description="Canton"),
+    district: str = Form(..., description="District"),
+    description: str = Form(..., min_length=10, description="Pet description (min 10 characters)"),
+    additional_details: Optional[str] = Form(None, description="Additional location details"),
+    images: List[UploadFile] = File(default=[], description="Pet images (max 5)")
+):
+    """
+    Report a lost pet, streaming intermediate results as Server-Sent Events
+    
+    Same parameters as `/api/v1/report/lost`. Emits `extraction`, `matches`
+    and `final` events (or `error`).
+    """
+    return await _stream_report(
+        "lost", province, canton, district, description,
+        additional_details, images
+    )
+
+
+@app.post("/api/v1/report/sighting/stream")
+async def report_sighting_stream(
+    province: str = Form(..., description="Province in Costa Rica"),
+    canton: str = Form(..., description="Canton"),
+    district: str = Form(..., description="District"),
+    description: str = Form(..., min_length=10, description="Sighting description (min 10 characters)"),
+    additional_details: Optional[str] = Form(None, description="Additional location details"),
+    images: List[UploadFile] = File(default=[], description="Sighting images (max 5)")
+):
+    """
+    Report a pet sighting, streaming intermediate results as Server-Sent Events
+    
+    Same parameters as `/api/v1/report/sighting`. Emits `extraction`, `matches`
+    and `final` events (or `error`).
+    """
+    return await _stream_report(
+        "sighting", province, canton, district, description,
+        additional_details, images
+    )
 
 
 @app.get("/api/v1/search")
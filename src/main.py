@@ -6,9 +6,16 @@ Coordinates all three agents in sequence to process pet reports.
 import os
 import sys
 import json
-from typing import Dict, Optional
+import asyncio
+import logging
+import functools
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, AsyncIterator
 from datetime import datetime
+import httpx
 from dotenv import load_dotenv
+from openai import OpenAI, AsyncOpenAI
+from pydantic import BaseModel
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -19,90 +26,164 @@ from src.agents.visual_extractor_agent import VisualTextExtractorAgent
 from src.agents.similarity_agent import MatchSimilarityAgent
 from src.agents.decision_agent import DecisionExplanationAgent
 
+log = logging.getLogger(__name__)
 
-def load_config() -> Dict:
+# Load .env file once per process
+if not os.getenv('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+
+def configure_logging():
+    """Configure application logging once; level comes from LOG_LEVEL (default INFO)."""
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s %(name)s %(levelname)s %(message)s"
+    )
+
+
+@dataclass(frozen=True)
+class Config:
+    """Application configuration loaded from environment variables."""
+    openai_api_key: str
+    vision_model: str = 'gpt-4o'
+    text_model: str = 'gpt-4o'
+    embedding_model: str = 'text-embedding-3-small'
+    similarity_threshold: float = 0.6
+    top_k_matches: int = 5
+    use_embeddings: bool = True
+    max_images_per_call: int = 3
+    vision_max_tokens: int = 500
+
+
+@functools.cache
+def load_config() -> Config:
     """
     Load configuration from environment variables.
     
+    The result is cached for the lifetime of the process.
+    
     Returns:
-        Dictionary with configuration settings
+        Config with configuration settings
     """
-    # Load .env file
-    load_dotenv()
-    
-    config = {
-        'openai_api_key': os.getenv('OPENAI_API_KEY'),
-        'vision_model': os.getenv('OPENAI_VISION_MODEL', 'gpt-4o'),
-        'text_model': os.getenv('OPENAI_MODEL', 'gpt-4o'),
-        'embedding_model': os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small'),
-        'similarity_threshold': float(os.getenv('SIMILARITY_THRESHOLD', '0.6')),
-        'top_k_matches': int(os.getenv('TOP_K_MATCHES', '5')),
-        'use_embeddings': os.getenv('USE_EMBEDDINGS', 'true').lower() == 'true'
-    }
+    config = Config(
+        openai_api_key=os.getenv('OPENAI_API_KEY'),
+        vision_model=os.getenv('OPENAI_VISION_MODEL', 'gpt-4o'),
+        text_model=os.getenv('OPENAI_MODEL', 'gpt-4o'),
+        embedding_model=os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small'),
+        similarity_threshold=float(os.getenv('SIMILARITY_THRESHOLD', '0.6')),
+        top_k_matches=int(os.getenv('TOP_K_MATCHES', '5')),
+        use_embeddings=os.getenv('USE_EMBEDDINGS', 'true').lower() == 'true',
+        max_images_per_call=int(os.getenv('MAX_IMAGES_PER_CALL', '3')),
+        vision_max_tokens=int(os.getenv('VISION_MAX_TOKENS', '500'))
+    )
     
     # Validate required config
-    if not config['openai_api_key']:
+    if not config.openai_api_key:
         raise ValueError("OPENAI_API_KEY not found in environment variables. Please set it in .env file.")
     
     return config
 
 
-def setup_agents(config: Dict) -> tuple:
+# Connection pool shared by every agent's OpenAI client
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT_SECONDS = 60.0
+
+# HTTP clients created by setup_agents, closed by close_shared_clients
+_shared_http_clients: List = []
+
+
+def create_openai_clients(api_key: str) -> tuple:
+    """
+    Create sync and async OpenAI clients backed by shared, pooled HTTP clients.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        Tuple of (OpenAI, AsyncOpenAI)
+    """
+    sync_http = httpx.Client(limits=HTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT_SECONDS, http2=True)
+    async_http = httpx.AsyncClient(limits=HTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT_SECONDS, http2=True)
+    _shared_http_clients.extend([sync_http, async_http])
+    
+    client = OpenAI(api_key=api_key, http_client=sync_http)
+    # Agent 1 retries its own calls with backoff, so SDK retries are disabled there
+    async_client = AsyncOpenAI(api_key=api_key, http_client=async_http, max_retries=0)
+    return client, async_client
+
+
+async def close_shared_clients():
+    """Close the pooled HTTP clients created by setup_agents."""
+    while _shared_http_clients:
+        http_client = _shared_http_clients.pop()
+        if isinstance(http_client, httpx.AsyncClient):
+            await http_client.aclose()
+        else:
+            http_client.close()
+
+
+def setup_agents(config: Config) -> tuple:
     """
     Initialize all three agents with configuration.
     
     Args:
-        config: Configuration dictionary
+        config: Application configuration
         
     Returns:
         Tuple of (agent1, agent2, agent3)
     """
-    print("\n" + "="*60)
-    print("INITIALIZING AI MULTI-AGENT SYSTEM")
-    print("="*60)
+    log.info("Initializing AI multi-agent system...")
+    
+    # One pooled client pair (single TLS handshake, keep-alive): the async client
+    # for Agent 1, the sync client for Agent 2's embeddings and Agent 3
+    client, async_client = create_openai_clients(config.openai_api_key)
     
     # Agent 1: Visual & Text Extractor
-    print("\n[Setup] Initializing Agent 1: Visual & Text Extractor...")
+    log.debug("Initializing Agent 1: Visual & Text Extractor...")
     agent1 = VisualTextExtractorAgent(
-        api_key=config['openai_api_key'],
-        vision_model=config['vision_model'],
-        text_model=config['text_model']
+        api_key=config.openai_api_key,
+        vision_model=config.vision_model,
+        text_model=config.text_model,
+        async_client=async_client,
+        max_images_per_call=config.max_images_per_call,
+        vision_max_tokens=config.vision_max_tokens
     )
-    print("  ✓ Agent 1 ready")
+    log.debug("Agent 1 ready")
     
     # Agent 2: Match & Similarity
-    print("\n[Setup] Initializing Agent 2: Match & Similarity...")
+    log.debug("Initializing Agent 2: Match & Similarity...")
     agent2 = MatchSimilarityAgent(
-        api_key=config['openai_api_key'],
-        use_embeddings=config['use_embeddings'],
-        top_k=config['top_k_matches'],
-        similarity_threshold=config['similarity_threshold']
+        api_key=config.openai_api_key,
+        use_embeddings=config.use_embeddings,
+        top_k=config.top_k_matches,
+        similarity_threshold=config.similarity_threshold,
+        client=client
     )
-    print(f"  ✓ Agent 2 ready (embeddings: {config['use_embeddings']})")
+    log.debug("Agent 2 ready (embeddings: %s)", config.use_embeddings)
     
     # Agent 3: Decision & Explanation
-    print("\n[Setup] Initializing Agent 3: Decision & Explanation...")
+    log.debug("Initializing Agent 3: Decision & Explanation...")
     agent3 = DecisionExplanationAgent(
-        api_key=config['openai_api_key'],
-        model=config['text_model']
+        api_key=config.openai_api_key,
+        model=config.text_model,
+        client=client
     )
-    print("  ✓ Agent 3 ready")
+    log.debug("Agent 3 ready")
     
-    print("\n" + "="*60)
-    print("ALL AGENTS INITIALIZED SUCCESSFULLY")
-    print("="*60 + "\n")
+    log.info("All agents initialized successfully")
     
     return agent1, agent2, agent3
 
 
-def process_pet_report(
+async def process_pet_report_stream(
     user_input: UserInput,
     agent1: VisualTextExtractorAgent,
     agent2: MatchSimilarityAgent,
     agent3: DecisionExplanationAgent
-) -> FinalOutput:
+) -> AsyncIterator[Tuple[str, BaseModel]]:
     """
-    Orchestrate the sequential agent pipeline.
+    Run the sequential agent pipeline, yielding each agent's result as soon as it is ready.
     
     Args:
         user_input: Validated user input
@@ -110,31 +191,34 @@ def process_pet_report(
         agent2: Match & Similarity Agent
         agent3: Decision & Explanation Agent
         
-    Returns:
-        FinalOutput with complete results
+    Yields:
+        ("extraction", PetDescription), then ("matches", MatchResult),
+        then ("final", FinalOutput)
         
     Raises:
         Exception: If any agent fails critically
     """
     start_time = datetime.now()
     
-    print("\n" + "="*60)
-    print("PROCESSING PET REPORT")
-    print("="*60)
-    print(f"Report Type: {user_input.report_type}")
-    print(f"Location: {user_input.location.canton}, {user_input.location.province}")
-    print(f"Images: {len(user_input.images)}")
-    print("="*60)
+    log.info(
+        "Processing %s report (location: %s, %s; images: %d)",
+        user_input.report_type,
+        user_input.location.canton,
+        user_input.location.province,
+        user_input.image_count
+    )
     
     try:
         # AGENT 1: Extract structured data
-        pet_description = agent1.process(user_input)
+        pet_description = await agent1.process(user_input)
+        yield "extraction", pet_description
         
-        # AGENT 2: Find matches
-        match_result = agent2.process(pet_description)
+        # AGENT 2: Find matches (sync, network-bound: keep it off the event loop)
+        match_result = await asyncio.to_thread(agent2.process, pet_description)
+        yield "matches", match_result
         
         # AGENT 3: Generate explanation and recommendations
-        final_output = agent3.process(pet_description, match_result)
+        final_output = await asyncio.to_thread(agent3.process, pet_description, match_result)
         
         # Calculate processing time
         end_time = datetime.now()
@@ -147,21 +231,71 @@ def process_pet_report(
             'end_time': end_time.isoformat()
         })
         
-        print("\n" + "="*60)
-        print("PROCESSING COMPLETE")
-        print("="*60)
-        print(f"Total Processing Time: {processing_time:.2f} seconds")
-        print("="*60 + "\n")
+        log.info("Processing complete in %.2f seconds", processing_time)
         
-        return final_output
+        yield "final", final_output
         
     except Exception as e:
-        print(f"\n❌ ERROR: Processing failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Processing failed: %s", e)
         raise
 
 
+async def process_pet_report(
+    user_input: UserInput,
+    agent1: VisualTextExtractorAgent,
+    agent2: MatchSimilarityAgent,
+    agent3: DecisionExplanationAgent
+) -> FinalOutput:
+    """
+    Orchestrate the sequential agent pipeline.
+    
+    Args:
+        user_input: Validated user input
+        agent1: Visual & Text Extractor Agent
+        agent2: Match & Similarity Agent
+        agent3: Decision & Explanation Agent
+        
+    Returns:
+        FinalOutput with complete results
+        
+    Raises:
+        Exception: If any agent fails critically
+    """
+    final_output = None
+    async for event, payload in process_pet_report_stream(user_input, agent1, agent2, agent3):
+        if event == "final":
+            final_output = payload
+    
+    return final_output
+
+
+async def process_pet_report_once(
+    user_input: UserInput,
+    agent1: VisualTextExtractorAgent,
+    agent2: MatchSimilarityAgent,
+    agent3: DecisionExplanationAgent
+) -> FinalOutput:
+    """
+    Process a single report, then close the pooled clients from setup_agents.
+    
+    For one-shot runs (CLI, test runner) that call asyncio.run per report: the
+    async pool is bound to the event loop, so it is closed inside that loop.
+    
+    Args:
+        user_input: Validated user input
+        agent1: Visual & Text Extractor Agent
+        agent2: Match & Similarity Agent
+        agent3: Decision & Explanation Agent
+        
+    Returns:
+        FinalOutput with complete results
+    """
+    try:
+        return await process_pet_report(user_input, agent1, agent2, agent3)
+    finally:
+        await close_shared_clients()
+
+
 def display_results(final_output: FinalOutput):
     """
     Display results in a user-friendly format.
@@ -228,13 +362,15 @@ def save_results(final_output: FinalOutput, output_path: str):
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(final_output.model_dump(), f, indent=2, ensure_ascii=False)
-        print(f"✓ Results saved to: {output_path}")
+        log.info("Results saved to: %s", output_path)
     except Exception as e:
-        print(f"Warning: Failed to save results: {e}")
+        log.warning("Failed to save results: %s", e)
 
 
 def main():
     """Main entry point for the application."""
+    configure_logging()
+    
     try:
         # Load configuration
         config = load_config()
@@ -244,7 +380,7 @@ def main():
         
         # Example: Process a test case
         # In production, this would come from an API or user interface
-        print("Loading example test case...")
+        log.info("Loading example test case...")
         
         # Example user input (you can modify this or load from examples)
         from src.models.pet_models import Location
@@ -263,8 +399,8 @@ def main():
             report_type="lost"
         )
         
-        # Process the report
-        final_output = process_pet_report(example_input, agent1, agent2, agent3)
+        # Process the report (closes the pooled clients when done)
+        final_output = asyncio.run(process_pet_report_once(example_input, agent1, agent2, agent3))
         
         # Display results
         display_results(final_output)
@@ -279,12 +415,10 @@ def main():
         return final_output
         
     except KeyboardInterrupt:
-        print("\n\nProcess interrupted by user.")
+        log.info("Process interrupted by user.")
         sys.exit(0)
     except Exception as e:
-        print(f"\n❌ FATAL ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Fatal error: %s", e)
         sys.exit(1)
 
 
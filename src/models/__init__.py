@@ -8,7 +8,9 @@ from .pet_models import (
     Location,
     PetDescription,
     UserInput,
-    PetReport
+    PetReport,
+    PetVisualSchema,
+    PetTextSchema
 )
 
 from .match_models import (
@@ -26,6 +28,8 @@ __all__ = [
     'PetDescription',
     'UserInput',
     'PetReport',
+    'PetVisualSchema',
+    'PetTextSchema',
     # Match models
     'ConfidenceLevel',
     'MatchCandidate',
@@ -3,7 +3,7 @@ Pydantic models for matching and similarity results.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 
@@ -17,6 +17,8 @@ class ConfidenceLevel(str, Enum):
 
 class MatchCandidate(BaseModel):
     """A potential match from the database."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     match_id: str = Field(..., description="ID of the matched report")
     report_type: str = Field(..., description="Type of matched report: 'lost' or 'sighting'")
     similarity_score: float = Field(
@@ -81,8 +83,8 @@ class MatchResult(BaseModel):
     def validate_top_match(cls, v: Optional[MatchCandidate], info) -> Optional[MatchCandidate]:
         """Ensure top_match is consistent with candidates."""
         candidates = info.data.get('candidates', [])
-        if v and v not in candidates:
-            # Top match should be from candidates list
+        # Top match should be from candidates list (match_id identifies a candidate)
+        if v and v.match_id not in {c.match_id for c in candidates}:
             return None
         return v
 
@@ -119,7 +121,14 @@ class FinalOutput(BaseModel):
     @classmethod
     def validate_actions(cls, v: List[str]) -> List[str]:
         """Ensure recommended actions are not empty."""
-        return [action.strip() for action in v if action and action.strip()]
+        actions = []
+        for action in v:
+            if not action:
+                continue
+            stripped = action.strip()
+            if stripped:
+                actions.append(stripped)
+        return actions
 
 
 # Export all models
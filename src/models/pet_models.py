@@ -3,11 +3,22 @@ Pydantic models for pet data validation and structured outputs.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from enum import Enum
 
 
+# Costa Rica's provinces (ordered for error messages)
+_PROVINCES = (
+    "San José", "Alajuela", "Cartago", "Heredia",
+    "Guanacaste", "Puntarenas", "Limón"
+)
+_VALID_PROVINCES = frozenset(_PROVINCES)
+_PROVINCE_ERROR = f"Province must be one of: {', '.join(_PROVINCES)}"
+
+_VALID_REPORT_TYPES = frozenset({"lost", "sighting"})
+
+
 class SpeciesType(str, Enum):
     """Valid pet species."""
     DOG = "dog"
@@ -24,6 +35,8 @@ class SizeType(str, Enum):
 
 class Location(BaseModel):
     """Location information for Costa Rica."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     province: str = Field(..., description="Province name in Costa Rica")
     canton: str = Field(..., description="Canton (county) name")
     district: str = Field(..., description="District name")
@@ -33,12 +46,8 @@ class Location(BaseModel):
     @classmethod
     def validate_province(cls, v: str) -> str:
         """Validate that province is one of Costa Rica's provinces."""
-        valid_provinces = [
-            "San José", "Alajuela", "Cartago", "Heredia", 
-            "Guanacaste", "Puntarenas", "Limón"
-        ]
-        if v not in valid_provinces:
-            raise ValueError(f"Province must be one of: {', '.join(valid_provinces)}")
+        if v not in _VALID_PROVINCES:
+            raise ValueError(_PROVINCE_ERROR)
         return v
 
     @field_validator('canton', 'district')
@@ -52,6 +61,8 @@ class Location(BaseModel):
 
 class PetDescription(BaseModel):
     """Structured pet description extracted from images and text."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     species: SpeciesType = Field(..., description="Type of animal")
     size: SizeType = Field(..., description="Size category of the pet")
     colors: List[str] = Field(..., min_length=1, description="Primary colors of the pet")
@@ -68,7 +79,13 @@ class PetDescription(BaseModel):
     @classmethod
     def validate_colors(cls, v: List[str]) -> List[str]:
         """Ensure colors are not empty strings."""
-        cleaned = [color.strip().lower() for color in v if color and color.strip()]
+        cleaned = []
+        for color in v:
+            if not color:
+                continue
+            stripped = color.strip()
+            if stripped:
+                cleaned.append(stripped.lower())
         if not cleaned:
             raise ValueError("At least one color must be provided")
         return cleaned
@@ -77,7 +94,14 @@ class PetDescription(BaseModel):
     @classmethod
     def clean_features(cls, v: List[str]) -> List[str]:
         """Clean and normalize distinctive features."""
-        return [feat.strip() for feat in v if feat and feat.strip()]
+        features = []
+        for feat in v:
+            if not feat:
+                continue
+            stripped = feat.strip()
+            if stripped:
+                features.append(stripped)
+        return features
 
 
 class UserInput(BaseModel):
@@ -87,6 +111,12 @@ class UserInput(BaseModel):
         max_length=5,
         description="File paths to pet images (max 5)"
     )
+    image_bytes: List[bytes] = Field(
+        default_factory=list,
+        max_length=5,
+        exclude=True,
+        description="In-memory image contents, e.g. API uploads (max 5)"
+    )
     description: str = Field(..., min_length=10, description="Free-text description of the pet")
     location: Location = Field(..., description="Location information")
     contact_info: Optional[str] = Field(None, description="Contact information (phone or email)")
@@ -104,13 +134,32 @@ class UserInput(BaseModel):
     @classmethod
     def validate_report_type(cls, v: str) -> str:
         """Validate report type."""
-        if v not in ["lost", "sighting"]:
+        if v not in _VALID_REPORT_TYPES:
             raise ValueError("report_type must be 'lost' or 'sighting'")
         return v
 
+    @model_validator(mode='after')
+    def validate_total_images(self) -> 'UserInput':
+        """Limit the combined number of image paths and in-memory images."""
+        if len(self.images) + len(self.image_bytes) > 5:
+            raise ValueError("Maximum 5 images allowed")
+        return self
+
+    @property
+    def image_count(self) -> int:
+        """Total number of images attached to the report."""
+        return len(self.images) + len(self.image_bytes)
+
+    @classmethod
+    def from_bytes(cls, images: List[bytes], **kwargs) -> 'UserInput':
+        """Build a UserInput from in-memory image contents instead of file paths."""
+        return cls(image_bytes=images, **kwargs)
+
 
 class PetReport(BaseModel):
     """Complete pet report stored in the database."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     report_id: str = Field(..., description="Unique identifier for the report")
     report_type: str = Field(..., description="Type: 'lost' or 'sighting'")
     pet_description: PetDescription = Field(..., description="Structured pet information")
@@ -127,11 +176,34 @@ class PetReport(BaseModel):
     @classmethod
     def validate_report_type(cls, v: str) -> str:
         """Validate report type."""
-        if v not in ["lost", "sighting"]:
+        if v not in _VALID_REPORT_TYPES:
             raise ValueError("report_type must be 'lost' or 'sighting'")
         return v
 
 
+class PetVisualSchema(BaseModel):
+    """Structured output schema for image analysis (OpenAI strict JSON schema)."""
+    model_config = ConfigDict(extra='forbid')
+
+    species: Optional[Literal["dog", "cat", "other"]] = Field(..., description="Type of animal")
+    size: Optional[Literal["small", "medium", "large"]] = Field(..., description="Size category of the pet")
+    colors: List[str] = Field(..., description="Primary colors of the pet")
+    distinctive_features: List[str] = Field(
+        ...,
+        description="Collar color, ear shape, markings, scars, tail characteristics, eye color, etc."
+    )
+    breed: Optional[str] = Field(..., description="Breed name, or null if unknown")
+    approximate_age: Optional[Literal["puppy", "young adult", "adult", "senior"]] = Field(
+        ...,
+        description="Estimated age, or null if unknown"
+    )
+
+
+class PetTextSchema(PetVisualSchema):
+    """Structured output schema for text analysis (OpenAI strict JSON schema)."""
+    additional_context: Optional[str] = Field(..., description="Any other relevant information")
+
+
 # Export all models
 __all__ = [
     'SpeciesType',
@@ -139,5 +211,7 @@ __all__ = [
     'Location',
     'PetDescription',
     'UserInput',
-    'PetReport'
+    'PetReport',
+    'PetVisualSchema',
+    'PetTextSchema'
 ]
@@ -12,10 +12,17 @@ from .data_access import (
 
 from .image_utils import (
     validate_image_format,
+    validate_image_bytes,
     resize_image_for_api,
     encode_image_to_base64,
+    encode_image_to_base64_bytes,
+    encode_image_bytes_to_base64,
+    decode_image_from_base64,
     get_image_info,
+    process_single_image,
+    process_single_image_bytes,
     process_multiple_images,
+    process_image_bytes,
     create_placeholder_image
 )
 
@@ -24,10 +31,14 @@ from .embedding_utils import (
     create_pet_embedding,
     create_text_embedding,
     cosine_similarity,
+    cosine_similarity_batch,
     batch_create_embeddings,
+    batch_create_embeddings_async,
     initialize_vector_store,
     add_to_vector_store,
-    search_vector_store
+    search_vector_store,
+    QuantizedVectorStore,
+    search_vector_store_quantized
 )
 
 __all__ = [
@@ -39,18 +50,29 @@ __all__ = [
     'search_all_reports',
     # Image utilities
     'validate_image_format',
+    'validate_image_bytes',
     'resize_image_for_api',
     'encode_image_to_base64',
+    'encode_image_to_base64_bytes',
+    'encode_image_bytes_to_base64',
+    'decode_image_from_base64',
     'get_image_info',
+    'process_single_image',
+    'process_single_image_bytes',
     'process_multiple_images',
+    'process_image_bytes',
     'create_placeholder_image',
     # Embedding utilities
     'create_pet_embedding_text',
     'create_pet_embedding',
     'create_text_embedding',
     'cosine_similarity',
+    'cosine_similarity_batch',
     'batch_create_embeddings',
+    'batch_create_embeddings_async',
     'initialize_vector_store',
     'add_to_vector_store',
-    'search_vector_store'
+    'search_vector_store',
+    'QuantizedVectorStore',
+    'search_vector_store_quantized'
 ]
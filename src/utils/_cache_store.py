@@ -0,0 +1,130 @@
+"""
+Shared key/value store behind the LLM response and embedding caches.
+
+Backed by diskcache when installed. The cache directory is only opened on
+first use, so importing a module that owns a store never touches the file
+system; if the directory cannot be opened (read-only, permissions, broken
+sqlite file) the store logs a warning and falls back to a size-bounded
+in-process LRU.
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+log = logging.getLogger(__name__)
+
+# Errors that mean the on-disk cache is unusable
+_DISK_ERRORS = (OSError, sqlite3.Error)
+
+
+class CacheStore:
+    """
+    Lazily opened disk cache with a bounded in-memory fallback.
+
+    Args:
+        directory: diskcache directory, opened on first get/set (None for memory only)
+        size_limit: Optional byte limit for the disk cache
+        memory_max_entries: Maximum entries kept by the in-memory fallback (LRU)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str],
+        size_limit: Optional[int] = None,
+        memory_max_entries: int = 1024
+    ):
+        self.directory = directory
+        self.size_limit = size_limit
+        self.memory_max_entries = memory_max_entries
+        self._disk = None
+        self._opened = False
+        self._lock = threading.Lock()
+        # key -> (expires_at or None, value), oldest first
+        self._memory: 'OrderedDict[str, tuple]' = OrderedDict()
+
+    def _open(self):
+        """Open the disk cache once; returns None when only memory is available."""
+        if self._opened:
+            return self._disk
+
+        with self._lock:
+            if not self._opened:
+                if diskcache is not None and self.directory is not None:
+                    kwargs = {} if self.size_limit is None else {'size_limit': self.size_limit}
+                    try:
+                        self._disk = diskcache.Cache(self.directory, **kwargs)
+                    except _DISK_ERRORS as e:
+                        log.warning("Cache directory %s unavailable, using memory: %s", self.directory, e)
+                self._opened = True
+        return self._disk
+
+    def _disable_disk(self, error: Exception) -> None:
+        """Stop using a disk cache that started failing."""
+        log.warning("Cache directory %s failed, using memory: %s", self.directory, error)
+        self._disk = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        disk = self._open()
+        if disk is not None:
+            try:
+                return disk.get(key)
+            except _DISK_ERRORS as e:
+                self._disable_disk(e)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._memory[key]
+                return None
+
+            self._memory.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store (must be picklable for the disk backend)
+            expire: Optional time-to-live in seconds
+        """
+        disk = self._open()
+        if disk is not None:
+            try:
+                disk.set(key, value, expire=expire)
+                return
+            except _DISK_ERRORS as e:
+                self._disable_disk(e)
+
+        expires_at = None if expire is None else time.monotonic() + expire
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_max_entries:
+                self._memory.popitem(last=False)
+
+
+__all__ = ['CacheStore']
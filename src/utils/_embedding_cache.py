@@ -0,0 +1,69 @@
+"""
+Persistent cache for OpenAI embeddings.
+Embeddings are deterministic for a given model and input, so they are stored
+content-addressed by (model, text hash) and reused across runs instead of
+calling the API again.
+
+Backed by diskcache when installed and the directory is usable (opened on
+first use, size-capped, evicting least recently stored entries), otherwise
+by a bounded in-process LRU.
+"""
+
+import os
+import hashlib
+from typing import List, Optional
+
+from src.utils._cache_store import CacheStore
+
+# Upper bound for the on-disk cache: 1 GB
+SIZE_LIMIT_BYTES = 1024 ** 3
+
+# Entries kept when falling back to memory (~12 KB of floats per 1536-d vector)
+MEMORY_MAX_ENTRIES = 4096
+
+CACHE_DIR = os.getenv('EMBEDDING_CACHE_DIR', './.emb_cache')
+
+_store = CacheStore(CACHE_DIR, size_limit=SIZE_LIMIT_BYTES, memory_max_entries=MEMORY_MAX_ENTRIES)
+
+
+def make_key(model: str, text: str) -> str:
+    """
+    Build the cache key for an embedding.
+
+    Args:
+        model: Embedding model name
+        text: Embedded text
+
+    Returns:
+        Key combining the model and a BLAKE2b digest of the text
+    """
+    return f"{model}:{hashlib.blake2b(text.encode('utf-8')).hexdigest()}"
+
+
+def get(model: str, text: str) -> Optional[List[float]]:
+    """
+    Get a cached embedding.
+
+    Args:
+        model: Embedding model name
+        text: Embedded text
+
+    Returns:
+        Cached embedding, or None if missing
+    """
+    return _store.get(make_key(model, text))
+
+
+def set(model: str, text: str, embedding: List[float]) -> None:
+    """
+    Store an embedding in the cache.
+
+    Args:
+        model: Embedding model name
+        text: Embedded text
+        embedding: Vector embedding
+    """
+    _store.set(make_key(model, text), embedding)
+
+
+__all__ = ['get', 'set', 'make_key', 'SIZE_LIMIT_BYTES']
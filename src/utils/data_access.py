@@ -6,9 +6,180 @@ without requiring an actual vector database during development/testing.
 
 import json
 import os
+import functools
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
-from src.models.pet_models import PetReport, PetDescription, Location
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
+from src.models.pet_models import PetReport, PetDescription, Location, SpeciesType, SizeType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Stable integer codes for the enum fields used by the vectorized search
+_SPECIES_IDS = {species: i for i, species in enumerate(SpeciesType)}
+_SIZE_IDS = {size: i for i, size in enumerate(SizeType)}
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_database(data_path: str, mtime: float) -> Dict:
+    """
+    Parse the mock database JSON file.
+    
+    Cached on (path, modification time) so every MockDatabase instance shares
+    one parsed copy, and an edited file is parsed again.
+    """
+    if orjson is not None:
+        with open(data_path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(data_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_report_date(date_str: str) -> datetime:
+    """
+    Parse an ISO-8601 report date (reports share few distinct date strings).
+    
+    Stored dates are naive local times; "Z"-suffixed or offset dates are
+    converted to naive local time so they compare with datetime.now().
+    """
+    parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+@functools.lru_cache(maxsize=16384)
+def _location_distance(
+    province1: str, canton1: str, district1: str,
+    province2: str, canton2: str, district2: str
+) -> float:
+    """Estimated distance in km between two locations, memoized per location pair."""
+    # Simple estimation based on location hierarchy
+    if province1 != province2:
+        return 50.0  # Different provinces, assume far
+    elif canton1 != canton2:
+        return 15.0  # Same province, different canton
+    elif district1 != district2:
+        return 3.0   # Same canton, different district
+    else:
+        return 0.5   # Same district, assume nearby
+
+
+# Validates a whole list of stored reports in one call
+_REPORT_LIST_ADAPTER = TypeAdapter(List[PetReport])
+
+
+class _SearchIndex:
+    """
+    Struct-of-arrays view of the reports used by the vectorized search.
+    
+    Each report is a row: enums and location names are interned to integer
+    codes, and colors/features become bitsets over a shared vocabulary
+    (one uint64 word per 64 terms).
+    """
+    
+    def __init__(self, reports: List[PetReport]):
+        """Encode the reports into NumPy arrays."""
+        self.reports = reports
+        self.is_lost = np.array([r.report_type == 'lost' for r in reports], dtype=bool)
+        
+        descriptions = [r.pet_description for r in reports]
+        self.species_ids = np.array([_SPECIES_IDS[d.species] for d in descriptions], dtype=np.int8)
+        self.size_ids = np.array([_SIZE_IDS[d.size] for d in descriptions], dtype=np.int8)
+        
+        self.location_vocab: Dict[str, int] = {}
+        locations = [d.last_seen_location for d in descriptions]
+        self.prov_ids = self._intern_locations([loc.province for loc in locations])
+        self.canton_ids = self._intern_locations([loc.canton for loc in locations])
+        self.district_ids = self._intern_locations([loc.district for loc in locations])
+        
+        self.color_vocab: Dict[str, int] = {}
+        self.colors_bitset, self.color_counts = self._encode_terms(
+            [d.colors for d in descriptions], self.color_vocab
+        )
+        self.feature_vocab: Dict[str, int] = {}
+        self.features_bitset, self.feature_counts = self._encode_terms(
+            [d.distinctive_features for d in descriptions], self.feature_vocab
+        )
+    
+    def _intern_locations(self, names: List[str]):
+        """Map location names to integer codes shared across province/canton/district."""
+        return np.array(
+            [self.location_vocab.setdefault(name, len(self.location_vocab)) for name in names],
+            dtype=np.int32
+        )
+    
+    @staticmethod
+    def _encode_terms(term_lists: List[List[str]], vocab: Dict[str, int]) -> Tuple:
+        """Build per-row bitsets and distinct-term counts, filling vocab as terms appear."""
+        term_sets = [{t.lower() for t in terms} for terms in term_lists]
+        for terms in term_sets:
+            for term in terms:
+                vocab.setdefault(term, len(vocab))
+        
+        words = max(1, (len(vocab) + 63) // 64)
+        bitset = np.zeros((len(term_sets), words), dtype=np.uint64)
+        for row, terms in enumerate(term_sets):
+            for term in terms:
+                bit = vocab[term]
+                bitset[row, bit // 64] |= np.uint64(1 << (bit % 64))
+        counts = np.array([len(terms) for terms in term_sets], dtype=np.int64)
+        return bitset, counts
+    
+    @staticmethod
+    def _jaccard(bitset, counts, vocab: Dict[str, int], query_terms: List[str]):
+        """Vectorized Jaccard similarity of each row's term set against the query terms."""
+        query_set = {t.lower() for t in query_terms}
+        if not query_set:
+            return np.zeros(len(counts))
+        
+        query_bits = np.zeros(bitset.shape[1], dtype=np.uint64)
+        for term in query_set:
+            bit = vocab.get(term)
+            if bit is not None:
+                query_bits[bit // 64] |= np.uint64(1 << (bit % 64))
+        
+        # Popcount via the byte view; terms outside the vocabulary only grow the union
+        overlap = np.unpackbits((bitset & query_bits).view(np.uint8), axis=1).sum(axis=1)
+        union = counts + len(query_set) - overlap
+        return np.divide(overlap, union, out=np.zeros(len(counts)), where=counts > 0)
+    
+    def score(self, query_pet: PetDescription):
+        """Score every row against the query (same weights as _calculate_similarity)."""
+        scores = np.zeros(len(self.reports))
+        
+        # A different species is never a match: only same-species rows are scored
+        rows = np.flatnonzero(self.species_ids == _SPECIES_IDS[query_pet.species])
+        if not len(rows):
+            return scores
+        
+        location = query_pet.last_seen_location
+        same_prov = self.prov_ids[rows] == self.location_vocab.get(location.province, -1)
+        same_canton = same_prov & (self.canton_ids[rows] == self.location_vocab.get(location.canton, -1))
+        same_district = same_canton & (self.district_ids[rows] == self.location_vocab.get(location.district, -1))
+        
+        # Accumulate in the scalar scorer's order so scores match it exactly
+        matched = np.full(len(rows), 0.3)
+        matched += 0.2 * (self.size_ids[rows] == _SIZE_IDS[query_pet.size])
+        matched += 0.2 * self._jaccard(
+            self.colors_bitset[rows], self.color_counts[rows], self.color_vocab, query_pet.colors
+        )
+        matched += 0.2 * self._jaccard(
+            self.features_bitset[rows], self.feature_counts[rows], self.feature_vocab,
+            query_pet.distinctive_features
+        )
+        matched += 0.05 * same_prov
+        matched += 0.03 * same_canton
+        matched += 0.02 * same_district
+        
+        scores[rows] = np.minimum(matched, 1.0)
+        return scores
 
 
 class MockDatabase:
@@ -18,6 +189,10 @@ class MockDatabase:
         """Initialize mock database with data path."""
         self.data_path = data_path
         self._data = None
+        self._index = None
+        self._lost_cache: Optional[List[PetReport]] = None
+        self._sight_cache: Optional[List[PetReport]] = None
+        self._by_id: Dict[str, PetReport] = {}
     
     def load_data(self) -> Dict:
         """Load mock data from JSON file."""
@@ -25,48 +200,56 @@ class MockDatabase:
             if not os.path.exists(self.data_path):
                 raise FileNotFoundError(f"Mock database file not found: {self.data_path}")
             
-            with open(self.data_path, 'r', encoding='utf-8') as f:
-                self._data = json.load(f)
+            self._data = _parse_database(self.data_path, os.path.getmtime(self.data_path))
+            
+            # Reports built from previously loaded data are stale
+            self._lost_cache = None
+            self._sight_cache = None
+            self._by_id = {}
+            self._index = None
         
         return self._data
     
-    def get_all_lost_pets(self) -> List[PetReport]:
-        """Get all lost pet reports."""
-        data = self.load_data()
-        reports = []
-        
-        for pet_data in data.get('lost_pets', []):
-            try:
-                report = PetReport(**pet_data)
-                reports.append(report)
-            except Exception as e:
-                print(f"Error loading lost pet {pet_data.get('report_id')}: {e}")
+    def _build_reports(self, key: str, label: str) -> List[PetReport]:
+        """Validate the reports stored under key and register them in the lookup tables."""
+        items = self.load_data().get(key, [])
+        try:
+            reports = _REPORT_LIST_ADAPTER.validate_python(items)
+        except ValidationError:
+            # Fall back to one report at a time so only invalid entries are skipped
+            reports = []
+            for report_data in items:
+                try:
+                    reports.append(PetReport.model_validate(report_data))
+                except ValidationError as e:
+                    print(f"Error loading {label} {report_data.get('report_id')}: {e}")
         
+        for report in reports:
+            self._by_id[report.report_id] = report
         return reports
     
+    def get_all_lost_pets(self) -> List[PetReport]:
+        """Get all lost pet reports."""
+        self.load_data()
+        if self._lost_cache is None:
+            self._lost_cache = self._build_reports('lost_pets', 'lost pet')
+        return list(self._lost_cache)
+    
     def get_all_sightings(self) -> List[PetReport]:
         """Get all sighting reports."""
-        data = self.load_data()
-        reports = []
-        
-        for sight_data in data.get('sightings', []):
-            try:
-                report = PetReport(**sight_data)
-                reports.append(report)
-            except Exception as e:
-                print(f"Error loading sighting {sight_data.get('report_id')}: {e}")
-        
-        return reports
+        self.load_data()
+        if self._sight_cache is None:
+            self._sight_cache = self._build_reports('sightings', 'sighting')
+        return list(self._sight_cache)
     
     def get_report_by_id(self, report_id: str) -> Optional[PetReport]:
         """Get a specific report by ID."""
-        all_reports = self.get_all_lost_pets() + self.get_all_sightings()
-        
-        for report in all_reports:
-            if report.report_id == report_id:
-                return report
-        
-        return None
+        self.load_data()
+        if self._lost_cache is None:
+            self._lost_cache = self._build_reports('lost_pets', 'lost pet')
+        if self._sight_cache is None:
+            self._sight_cache = self._build_reports('sightings', 'sighting')
+        return self._by_id.get(report_id)
     
     def search_similar_pets(
         self, 
@@ -86,59 +269,68 @@ class MockDatabase:
         Returns:
             List of (report, score) tuples sorted by similarity
         """
-        # Get all reports
-        reports = []
-        if report_type is None or report_type == 'lost':
-            reports.extend(self.get_all_lost_pets())
-        if report_type is None or report_type == 'sighting':
-            reports.extend(self.get_all_sightings())
-        
-        # Calculate similarity scores
-        scored_reports = []
-        for report in reports:
-            score = self._calculate_similarity(query_pet, report.pet_description)
-            scored_reports.append((report, score))
+        if self._index is None:
+            self._index = _SearchIndex(self.get_all_lost_pets() + self.get_all_sightings())
+        index = self._index
+        
+        rows = np.arange(len(index.reports))
+        if report_type == 'lost':
+            rows = rows[index.is_lost]
+        elif report_type == 'sighting':
+            rows = rows[~index.is_lost]
+        if top_k <= 0 or not len(rows):
+            return []
         
-        # Sort by score (highest first) and return top_k
-        scored_reports.sort(key=lambda x: x[1], reverse=True)
-        return scored_reports[:top_k]
+        scores = index.score(query_pet)[rows]
+        
+        # Partial selection; keep every row tied with the k-th score so the
+        # stable sort below breaks ties in report order
+        if top_k < len(scores):
+            kth_score = np.partition(scores, -top_k)[-top_k]
+            candidates = np.flatnonzero(scores >= kth_score)
+        else:
+            candidates = np.arange(len(scores))
+        top = candidates[np.argsort(-scores[candidates], kind='stable')][:top_k]
+        
+        return [(index.reports[rows[i]], float(scores[i])) for i in top]
     
     def _calculate_similarity(self, pet1: PetDescription, pet2: PetDescription) -> float:
         """
         Calculate simple similarity score between two pet descriptions.
         This is a basic algorithm that will be replaced by actual vector similarity.
         
-        Scoring factors:
+        Different species never match and score 0.0; otherwise:
         - Species match: 0.3
         - Size match: 0.2
         - Color overlap: 0.2
         - Feature overlap: 0.2
         - Location proximity: 0.1
-        """
-        score = 0.0
         
-        # Species match (30%)
-        if pet1.species == pet2.species:
-            score += 0.3
+        Reference scorer for _SearchIndex.score, which computes the same scores
+        for all reports at once.
+        """
+        # Species match (30%); enum members are singletons
+        if pet1.species is not pet2.species:
+            return 0.0
+        score = 0.3
         
         # Size match (20%)
-        if pet1.size == pet2.size:
+        if pet1.size is pet2.size:
             score += 0.2
         
         # Color overlap (20%)
-        colors1 = set(c.lower() for c in pet1.colors)
-        colors2 = set(c.lower() for c in pet2.colors)
+        colors1 = {c.lower() for c in pet1.colors}
+        colors2 = {c.lower() for c in pet2.colors}
         if colors1 and colors2:
             color_overlap = len(colors1 & colors2) / len(colors1 | colors2)
             score += 0.2 * color_overlap
         
         # Distinctive features overlap (20%)
-        if pet1.distinctive_features and pet2.distinctive_features:
-            features1 = set(f.lower() for f in pet1.distinctive_features)
-            features2 = set(f.lower() for f in pet2.distinctive_features)
-            if features1 and features2:
-                feature_overlap = len(features1 & features2) / len(features1 | features2)
-                score += 0.2 * feature_overlap
+        features1 = {f.lower() for f in pet1.distinctive_features}
+        features2 = {f.lower() for f in pet2.distinctive_features}
+        if features1 and features2:
+            feature_overlap = len(features1 & features2) / len(features1 | features2)
+            score += 0.2 * feature_overlap
         
         # Location proximity (10%)
         if pet1.last_seen_location.province == pet2.last_seen_location.province:
@@ -157,23 +349,22 @@ class MockDatabase:
         
         Returns estimated distance in kilometers.
         """
-        # Simple estimation based on location hierarchy
-        if loc1.province != loc2.province:
-            return 50.0  # Different provinces, assume far
-        elif loc1.canton != loc2.canton:
-            return 15.0  # Same province, different canton
-        elif loc1.district != loc2.district:
-            return 3.0   # Same canton, different district
-        else:
-            return 0.5   # Same district, assume nearby
+        return _location_distance(
+            loc1.province, loc1.canton, loc1.district,
+            loc2.province, loc2.canton, loc2.district
+        )
     
-    def calculate_days_since(self, date_str: str) -> int:
-        """Calculate number of days since a given date."""
+    def calculate_days_since(self, date_str: str, now: Optional[datetime] = None) -> int:
+        """
+        Calculate number of days since a given date.
+        
+        Pass now (naive local time, as from datetime.now()) when scoring many
+        reports so the clock is read once per query.
+        """
         try:
-            report_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            now = datetime.now()
-            delta = now - report_date
-            return delta.days
+            if now is None:
+                now = datetime.now()
+            return (now - _parse_report_date(date_str)).days
         except Exception:
             return 0
 
@@ -4,9 +4,72 @@ Functions for creating embeddings and managing vector database operations.
 """
 
 import os
-from typing import List, Dict, Optional, Tuple
-from openai import OpenAI
+import asyncio
+import itertools
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
+import numpy as np
+import openai
+from openai import OpenAI, AsyncOpenAI
+from tenacity import retry, retry_if_exception_type, wait_exponential_jitter, stop_after_attempt
 from src.models.pet_models import PetDescription
+from src.utils import _embedding_cache as embedding_cache
+
+# Inputs per embeddings request (the API accepts at most 2048)
+EMBEDDING_CHUNK_SIZE = 500
+
+# Transient API errors worth retrying with backoff
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError
+)
+
+# One client per API key, reused across calls to keep connections alive
+_client_cache: Dict[str, OpenAI] = {}
+
+
+def _get_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    Get the shared OpenAI client for an API key.
+    
+    Args:
+        api_key: OpenAI API key (uses env var if not provided)
+        
+    Returns:
+        Cached OpenAI client
+        
+    Raises:
+        ValueError: If no API key is available
+    """
+    if api_key is None:
+        api_key = os.getenv('OPENAI_API_KEY')
+    
+    if not api_key:
+        raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
+    
+    client = _client_cache.get(api_key)
+    if client is None:
+        client = _client_cache[api_key] = OpenAI(api_key=api_key)
+    return client
+
+
+def _embed_text(
+    text: str,
+    api_key: Optional[str],
+    model: str,
+    client: Optional[OpenAI] = None
+) -> List[float]:
+    """Embed a single text, serving repeats from the embedding cache."""
+    embedding = embedding_cache.get(model, text)
+    if embedding is None:
+        response = (client or _get_client(api_key)).embeddings.create(
+            model=model,
+            input=text
+        )
+        embedding = response.data[0].embedding
+        embedding_cache.set(model, text, embedding)
+    return embedding
 
 
 def create_pet_embedding_text(pet_data: PetDescription) -> str:
@@ -19,42 +82,25 @@ def create_pet_embedding_text(pet_data: PetDescription) -> str:
     Returns:
         Text representation optimized for embedding
     """
-    parts = []
-    
-    # Species and size
-    parts.append(f"{pet_data.size} {pet_data.species}")
-    
-    # Breed if available
-    if pet_data.breed:
-        parts.append(f"breed: {pet_data.breed}")
-    
-    # Colors
-    colors_text = ", ".join(pet_data.colors)
-    parts.append(f"colors: {colors_text}")
-    
-    # Distinctive features
-    if pet_data.distinctive_features:
-        features_text = ", ".join(pet_data.distinctive_features)
-        parts.append(f"features: {features_text}")
-    
-    # Age
-    if pet_data.approximate_age:
-        parts.append(f"age: {pet_data.approximate_age}")
-    
-    # Location
     location = pet_data.last_seen_location
-    parts.append(f"location: {location.district}, {location.canton}, {location.province}")
-    
-    if location.additional_details:
-        parts.append(f"details: {location.additional_details}")
     
-    return " | ".join(parts)
+    # Built in one join; optional sections collapse to empty strings
+    return "".join((
+        f"{pet_data.size.value} {pet_data.species.value}",
+        f" | breed: {pet_data.breed}" if pet_data.breed else "",
+        f" | colors: {', '.join(pet_data.colors)}",
+        f" | features: {', '.join(pet_data.distinctive_features)}" if pet_data.distinctive_features else "",
+        f" | age: {pet_data.approximate_age}" if pet_data.approximate_age else "",
+        f" | location: {location.district}, {location.canton}, {location.province}",
+        f" | details: {location.additional_details}" if location.additional_details else ""
+    ))
 
 
 def create_pet_embedding(
     pet_data: PetDescription, 
     api_key: Optional[str] = None,
-    model: str = "text-embedding-3-small"
+    model: str = "text-embedding-3-small",
+    client: Optional[OpenAI] = None
 ) -> List[float]:
     """
     Generate vector embedding from structured pet data.
@@ -63,6 +109,7 @@ def create_pet_embedding(
         pet_data: Structured pet description
         api_key: OpenAI API key (uses env var if not provided)
         model: Embedding model to use
+        client: Shared OpenAI client (defaults to the cached client for api_key)
         
     Returns:
         Vector embedding as list of floats
@@ -71,27 +118,11 @@ def create_pet_embedding(
         ValueError: If API key is missing or API call fails
     """
     try:
-        # Get API key
-        if api_key is None:
-            api_key = os.getenv('OPENAI_API_KEY')
-        
-        if not api_key:
-            raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
-        
-        # Create OpenAI client
-        client = OpenAI(api_key=api_key)
-        
         # Convert pet data to text
         text = create_pet_embedding_text(pet_data)
         
-        # Create embedding
-        response = client.embeddings.create(
-            model=model,
-            input=text
-        )
-        
-        embedding = response.data[0].embedding
-        return embedding
+        # Create embedding (cached by model and text)
+        return _embed_text(text, api_key, model, client)
         
     except Exception as e:
         raise ValueError(f"Failed to create embedding: {e}")
@@ -100,7 +131,8 @@ def create_pet_embedding(
 def create_text_embedding(
     text: str,
     api_key: Optional[str] = None,
-    model: str = "text-embedding-3-small"
+    model: str = "text-embedding-3-small",
+    client: Optional[OpenAI] = None
 ) -> List[float]:
     """
     Generate vector embedding from raw text.
@@ -109,34 +141,23 @@ def create_text_embedding(
         text: Text to embed
         api_key: OpenAI API key (uses env var if not provided)
         model: Embedding model to use
+        client: Shared OpenAI client (defaults to the cached client for api_key)
         
     Returns:
         Vector embedding as list of floats
     """
     try:
-        # Get API key
-        if api_key is None:
-            api_key = os.getenv('OPENAI_API_KEY')
-        
-        if not api_key:
-            raise ValueError("OpenAI API key not found")
-        
-        # Create OpenAI client
-        client = OpenAI(api_key=api_key)
-        
-        # Create embedding
-        response = client.embeddings.create(
-            model=model,
-            input=text
-        )
-        
-        return response.data[0].embedding
+        # Create embedding (cached by model and text)
+        return _embed_text(text, api_key, model, client)
         
     except Exception as e:
         raise ValueError(f"Failed to create text embedding: {e}")
 
 
-def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+def cosine_similarity(
+    vec1: Union[np.ndarray, List[float]],
+    vec2: Union[np.ndarray, List[float]]
+) -> float:
     """
     Calculate cosine similarity between two vectors.
     
@@ -147,53 +168,169 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     Returns:
         Similarity score between -1 and 1 (higher is more similar)
     """
-    import math
+    a = np.asarray(vec1, dtype=np.float32)
+    b = np.asarray(vec2, dtype=np.float32)
     
-    if len(vec1) != len(vec2):
+    if a.shape != b.shape:
         raise ValueError("Vectors must have same length")
     
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = math.sqrt(sum(a * a for a in vec1))
-    magnitude2 = math.sqrt(sum(b * b for b in vec2))
-    
-    if magnitude1 == 0 or magnitude2 == 0:
+    magnitude = np.linalg.norm(a) * np.linalg.norm(b)
+    if magnitude == 0:
         return 0.0
     
-    similarity = dot_product / (magnitude1 * magnitude2)
-    return similarity
+    return float(a @ b / magnitude)
+
+
+def cosine_similarity_batch(
+    query: Union[np.ndarray, List[float]],
+    matrix: Union[np.ndarray, List[List[float]]],
+    norms: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Calculate cosine similarity between a query and every row of a matrix.
+    
+    Args:
+        query: Query vector
+        matrix: One embedding per row
+        norms: Precomputed row norms (computed if not provided)
+        
+    Returns:
+        Array of similarity scores, one per row (0 for zero-length vectors)
+    """
+    q = np.asarray(query, dtype=np.float32)
+    m = np.asarray(matrix, dtype=np.float32)
+    
+    if m.ndim != 2 or m.shape[1] != q.shape[0]:
+        raise ValueError("Vectors must have same length")
+    
+    if norms is None:
+        norms = np.linalg.norm(m, axis=1)
+    magnitudes = norms * np.linalg.norm(q)
+    
+    return np.divide(m @ q, magnitudes, out=np.zeros(len(m), dtype=np.float32), where=magnitudes > 0)
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Yield consecutive chunks of at most size items."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
 
 
 def batch_create_embeddings(
     texts: List[str],
     api_key: Optional[str] = None,
-    model: str = "text-embedding-3-small"
+    model: str = "text-embedding-3-small",
+    chunk_size: int = EMBEDDING_CHUNK_SIZE,
+    client: Optional[OpenAI] = None
 ) -> List[List[float]]:
     """
     Create embeddings for multiple texts in batch (more efficient).
     
+    Cached embeddings are reused; only the remaining texts are sent, in
+    chunks of chunk_size to stay within the API's per-request input limit.
+    
     Args:
         texts: List of texts to embed
         api_key: OpenAI API key
         model: Embedding model to use
+        chunk_size: Maximum texts per API request
+        client: Shared OpenAI client (defaults to the cached client for api_key)
         
     Returns:
-        List of embeddings
+        List of embeddings (same order as texts)
     """
     try:
+        embeddings = [embedding_cache.get(model, text) for text in texts]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            client = client or _get_client(api_key)
+            for chunk in _chunked(missing, chunk_size):
+                response = client.embeddings.create(
+                    model=model,
+                    input=[texts[i] for i in chunk]
+                )
+                for i, data in zip(chunk, response.data):
+                    embeddings[i] = data.embedding
+                    embedding_cache.set(model, texts[i], data.embedding)
+        
+        return embeddings
+        
+    except Exception as e:
+        raise ValueError(f"Failed to create batch embeddings: {e}")
+
+
+@retry(
+    retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+async def _create_embeddings_chunk(client: AsyncOpenAI, model: str, texts: List[str]) -> List[List[float]]:
+    """Embed one chunk of texts, retrying rate limits and transient failures with backoff."""
+    response = await client.embeddings.create(model=model, input=texts)
+    return [data.embedding for data in response.data]
+
+
+async def batch_create_embeddings_async(
+    texts: List[str],
+    api_key: Optional[str] = None,
+    model: str = "text-embedding-3-small",
+    chunk_size: int = EMBEDDING_CHUNK_SIZE,
+    concurrency: int = 8,
+    client: Optional[AsyncOpenAI] = None
+) -> List[List[float]]:
+    """
+    Create embeddings for many texts with concurrent chunked requests.
+    
+    Cached embeddings are reused; only the remaining texts are sent.
+    
+    Args:
+        texts: List of texts to embed
+        api_key: OpenAI API key (uses env var if not provided)
+        model: Embedding model to use
+        chunk_size: Maximum texts per API request
+        concurrency: Maximum requests in flight
+        client: Shared AsyncOpenAI client to reuse its connection pool
+            (ideally created with max_retries=0); if not provided, a
+            temporary client is created and closed for this call
+        
+    Returns:
+        List of embeddings (same order as texts)
+        
+    Raises:
+        ValueError: If API key is missing or API call fails
+    """
+    embeddings = [embedding_cache.get(model, text) for text in texts]
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if not missing:
+        return embeddings
+    
+    if client is None:
         if api_key is None:
             api_key = os.getenv('OPENAI_API_KEY')
         
         if not api_key:
-            raise ValueError("OpenAI API key not found")
-        
-        client = OpenAI(api_key=api_key)
-        
-        response = client.embeddings.create(
-            model=model,
-            input=texts
-        )
+            raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def embed(client: AsyncOpenAI, chunk: List[int]) -> None:
+        async with semaphore:
+            chunk_embeddings = await _create_embeddings_chunk(client, model, [texts[i] for i in chunk])
+        for i, embedding in zip(chunk, chunk_embeddings):
+            embeddings[i] = embedding
+            embedding_cache.set(model, texts[i], embedding)
+    
+    try:
+        if client is not None:
+            await asyncio.gather(*(embed(client, chunk) for chunk in _chunked(missing, chunk_size)))
+        else:
+            # SDK retries disabled: _create_embeddings_chunk owns the retry policy
+            async with AsyncOpenAI(api_key=api_key, max_retries=0) as own_client:
+                await asyncio.gather(*(embed(own_client, chunk) for chunk in _chunked(missing, chunk_size)))
         
-        embeddings = [data.embedding for data in response.data]
         return embeddings
         
     except Exception as e:
@@ -288,16 +425,150 @@ def search_vector_store(
             where=filter_metadata
         )
         
-        # Format results
-        formatted = []
-        for i in range(len(results['ids'][0])):
-            formatted.append({
-                'id': results['ids'][0][i],
-                'distance': results['distances'][0][i],
-                'metadata': results['metadatas'][0][i]
-            })
+        # Format results (first query only)
+        ids, distances, metadatas = results['ids'][0], results['distances'][0], results['metadatas'][0]
+        return [
+            {'id': pet_id, 'distance': distance, 'metadata': metadata}
+            for pet_id, distance, metadata in zip(ids, distances, metadatas)
+        ]
+        
+    except Exception as e:
+        print(f"Failed to search vector store: {e}")
+        return []
+
+
+def _quantize(embedding: Union[np.ndarray, List[float]]) -> Tuple[np.ndarray, float]:
+    """L2-normalize a vector and quantize it to int8, returning (values, scale)."""
+    v = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(v)
+    if norm > 0:
+        v = v / norm
+    max_abs = float(np.abs(v).max()) if v.size else 0.0
+    if max_abs == 0:
+        return np.zeros(v.shape, dtype=np.int8), 0.0
+    return np.round(v / max_abs * 127).astype(np.int8), max_abs / 127
+
+
+class QuantizedVectorStore:
+    """
+    In-memory vector store holding int8-quantized, L2-normalized embeddings.
+    
+    Exposes the same add() signature as a ChromaDB collection, so it can be
+    passed to add_to_vector_store, and is queried with
+    search_vector_store_quantized. Storing int8 instead of float32 cuts the
+    memory streamed per query by 4x.
+    """
+    
+    def __init__(self):
+        """Initialize an empty store."""
+        self.ids: List[str] = []
+        self.metadatas: List[Dict] = []
+        self._rows: List[np.ndarray] = []
+        self._scales: List[float] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._scale_array: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        """Number of stored embeddings."""
+        return len(self.ids)
+    
+    def add(self, ids: List[str], embeddings: List[List[float]], metadatas: Optional[List[Dict]] = None):
+        """
+        Quantize and store embeddings.
+        
+        Args:
+            ids: Unique identifiers
+            embeddings: Vector embeddings (float)
+            metadatas: Additional data per embedding
+        """
+        if metadatas is None:
+            metadatas = [{} for _ in ids]
+        if not len(ids) == len(embeddings) == len(metadatas):
+            raise ValueError("ids, embeddings and metadatas must have the same length")
+        
+        for pet_id, embedding, metadata in zip(ids, embeddings, metadatas):
+            values, scale = _quantize(embedding)
+            if self._rows and values.shape != self._rows[0].shape:
+                raise ValueError("Vectors must have same length")
+            self.ids.append(pet_id)
+            self.metadatas.append(metadata)
+            self._rows.append(values)
+            self._scales.append(scale)
+        
+        # Rebuilt on the next query
+        self._matrix = None
+    
+    def scores(self, query_embedding: Union[np.ndarray, List[float]]) -> np.ndarray:
+        """
+        Approximate cosine similarity between the query and every stored vector.
+        
+        Args:
+            query_embedding: Query vector
+            
+        Returns:
+            Array of similarity scores in insertion order
+        """
+        if not self._rows:
+            return np.zeros(0, dtype=np.float32)
+        
+        if self._matrix is None:
+            self._matrix = np.stack(self._rows)
+            self._scale_array = np.array(self._scales, dtype=np.float32)
+        
+        query, query_scale = _quantize(query_embedding)
+        if query.shape[0] != self._matrix.shape[1]:
+            raise ValueError("Vectors must have same length")
+        
+        # Accumulate in int32: int8 products overflow int8
+        dots = self._matrix.astype(np.int32) @ query.astype(np.int32)
+        return dots * (self._scale_array * np.float32(query_scale))
+
+
+def search_vector_store_quantized(
+    store: QuantizedVectorStore,
+    query_embedding: List[float],
+    top_k: int = 5,
+    filter_metadata: Optional[Dict] = None
+) -> List[Dict]:
+    """
+    Search a quantized in-memory store for similar pets.
+    
+    Args:
+        store: QuantizedVectorStore to search
+        query_embedding: Query vector
+        top_k: Number of results to return
+        filter_metadata: Optional metadata equality filters (e.g. {"species": "dog"})
+        
+    Returns:
+        List of results with IDs, cosine distances, and metadata (closest first)
+    """
+    try:
+        scores = store.scores(query_embedding)
+        
+        rows = np.arange(len(scores))
+        if filter_metadata:
+            rows = np.array([
+                i for i in rows
+                if all(store.metadatas[i].get(key) == value for key, value in filter_metadata.items())
+            ], dtype=np.intp)
+        if top_k <= 0 or not len(rows):
+            return []
+        
+        candidate_scores = scores[rows]
+        if top_k < len(rows):
+            top = np.argpartition(candidate_scores, -top_k)[-top_k:]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-candidate_scores[top], kind='stable')]
         
-        return formatted
+        return [
+            {
+                'id': store.ids[rows[i]],
+                'distance': 1.0 - float(candidate_scores[i]),
+                'metadata': store.metadatas[rows[i]]
+            }
+            for i in top
+        ]
         
     except Exception as e:
         print(f"Failed to search vector store: {e}")
@@ -310,8 +581,12 @@ __all__ = [
     'create_pet_embedding',
     'create_text_embedding',
     'cosine_similarity',
+    'cosine_similarity_batch',
     'batch_create_embeddings',
+    'batch_create_embeddings_async',
     'initialize_vector_store',
     'add_to_vector_store',
-    'search_vector_store'
+    'search_vector_store',
+    'QuantizedVectorStore',
+    'search_vector_store_quantized'
 ]
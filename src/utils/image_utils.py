@@ -5,16 +5,113 @@ Functions for validation, resizing, encoding, and batch processing.
 
 import os
 import base64
-from typing import List, Tuple, Optional, Dict
-from pathlib import Path
-from PIL import Image
+import hashlib
+import logging
+from binascii import b2a_base64
+import functools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional, Dict, Union, BinaryIO
+import PIL
+from PIL import Image, ImageDraw, ImageFont
+
+from src.utils._cache_store import CacheStore
 import io
 
+log = logging.getLogger(__name__)
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 
 # Supported image formats
-SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
+SUPPORTED_FORMATS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp'})  # File extensions, no dot
+SUPPORTED_PIL_FORMATS = {'JPEG', 'PNG', 'GIF', 'BMP', 'WEBP'}
+# Preformatted for log messages
+_SUPPORTED_FORMATS_TEXT = ', '.join(sorted(SUPPORTED_FORMATS))
+_SUPPORTED_PIL_FORMATS_TEXT = ', '.join(sorted(SUPPORTED_PIL_FORMATS))
 MAX_IMAGE_SIZE_MB = 5
 MAX_DIMENSION = 2048  # Max width or height for API efficiency
+LOW_DETAIL_SIZE = (512, 512)  # OpenAI "low" detail resolution (fixed ~85 tokens per image)
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)  # Thread cap for batch processing
+
+# Pillow-SIMD (drop-in, vectorized resize and decode) publishes '.postN' versions
+PILLOW_SIMD = '.post' in PIL.__version__
+
+IMAGE_BACKENDS = ('pil', 'cv2')  # Decode/resize/encode backends for file batches
+ENCODE_CACHE_SIZE = 128  # Base64 encodings of files kept for re-submitted images
+
+# Processed in-memory uploads, keyed by content digest (memory only)
+_bytes_results = CacheStore(None, memory_max_entries=ENCODE_CACHE_SIZE)
+
+# Loaded once instead of on every placeholder
+_DEFAULT_FONT = ImageFont.load_default()
+
+
+def _b64encode(data: bytes) -> bytes:
+    """Base64-encode bytes, using pybase64's SIMD kernels when available."""
+    if pybase64 is not None:
+        return pybase64.b64encode(data)
+    # binascii directly: same output as base64.b64encode without the wrapper
+    return b2a_base64(data, newline=False)
+
+
+def _b64decode(data: Union[str, bytes]) -> bytes:
+    """
+    Strictly base64-decode data, using pybase64's SIMD kernels when available.
+    
+    validate=True rejects non-alphabet characters; pybase64 fuses that check into
+    the SIMD decode, so it costs no separate pass. Always decode with it rather
+    than the lenient default, which silently drops invalid characters.
+    """
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=True)
+    return base64.b64decode(data, validate=True)
+
+
+def _has_image_signature(header: bytes) -> bool:
+    """Check the leading bytes of a file against the supported image signatures."""
+    return (
+        header.startswith((b'\xff\xd8\xff', b'\x89PNG', b'GIF8', b'BM'))
+        or (header[:4] == b'RIFF' and header[8:12] == b'WEBP')
+    )
+
+
+def _check_path(file_path: str) -> Optional[os.stat_result]:
+    """
+    Check that an image file exists and has a supported extension.
+    
+    Uses a single stat call; the result is returned so callers can reuse its size.
+    
+    Args:
+        file_path: Path to the image file
+        
+    Returns:
+        The file's stat result, or None if the check failed
+    """
+    # Check if file exists
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        log.debug("File not found: %s", file_path)
+        return None
+    
+    # Check file extension (plain string slicing; a leading dot is a hidden file, not an extension)
+    name = os.path.basename(file_path)
+    dot = name.rfind('.')
+    file_ext = name[dot + 1:].lower() if dot > 0 else ''
+    if file_ext not in SUPPORTED_FORMATS:
+        log.debug("Unsupported format: %s. Supported: %s", file_ext, _SUPPORTED_FORMATS_TEXT)
+        return None
+    
+    return st
 
 
 def validate_image_format(file_path: str) -> bool:
@@ -28,75 +125,232 @@ def validate_image_format(file_path: str) -> bool:
         True if valid image, False otherwise
     """
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
-            print(f"File not found: {file_path}")
+        # Check that the file exists and has a supported extension
+        st = _check_path(file_path)
+        if st is None:
+            return False
+        
+        # Check file size before touching the contents
+        file_size_mb = st.st_size / (1024 * 1024)
+        if file_size_mb > MAX_IMAGE_SIZE_MB:
+            log.debug("File too large: %.2fMB (max: %sMB)", file_size_mb, MAX_IMAGE_SIZE_MB)
             return False
         
-        # Check file extension
-        file_ext = Path(file_path).suffix.lower()
-        if file_ext not in SUPPORTED_FORMATS:
-            print(f"Unsupported format: {file_ext}. Supported: {SUPPORTED_FORMATS}")
+        # Sniff the magic bytes instead of a full verify(); structural
+        # corruption surfaces when the image is actually decoded
+        with open(file_path, 'rb') as f:
+            header = f.read(12)
+        if not _has_image_signature(header):
+            log.debug("Unrecognized image signature: %s", file_path)
             return False
         
-        # Try to open with PIL to verify it's a valid image
-        with Image.open(file_path) as img:
-            img.verify()
+        # Confirm PIL can parse the header (lazy, no pixel decode)
+        Image.open(file_path).close()
         
-        # Check file size
-        file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+        return True
+        
+    except Exception as e:
+        log.debug("Error validating image %s: %s", file_path, e)
+        return False
+
+
+def validate_image_bytes(image_bytes: bytes) -> bool:
+    """
+    Validate in-memory image contents (e.g. an upload that was never written to disk).
+    
+    Args:
+        image_bytes: Raw image file contents
+        
+    Returns:
+        True if valid image, False otherwise
+    """
+    try:
+        # Check size
+        file_size_mb = len(image_bytes) / (1024 * 1024)
         if file_size_mb > MAX_IMAGE_SIZE_MB:
-            print(f"File too large: {file_size_mb:.2f}MB (max: {MAX_IMAGE_SIZE_MB}MB)")
+            log.debug("Image too large: %.2fMB (max: %sMB)", file_size_mb, MAX_IMAGE_SIZE_MB)
+            return False
+        
+        if not _has_image_signature(image_bytes[:12]):
+            log.debug("Unrecognized image signature")
             return False
         
+        # Confirm PIL can parse the header in a supported format (no pixel decode)
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            if img.format not in SUPPORTED_PIL_FORMATS:
+                log.debug("Unsupported format: %s. Supported: %s", img.format, _SUPPORTED_PIL_FORMATS_TEXT)
+                return False
+        
         return True
         
     except Exception as e:
-        print(f"Error validating image {file_path}: {e}")
+        log.debug("Error validating image bytes: %s", e)
         return False
 
 
-def resize_image_for_api(image_path: str, max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION)) -> bytes:
+def _resize_opened(
+    img: Image.Image,
+    max_size: Tuple[int, int],
+    resample: Image.Resampling = Image.Resampling.BILINEAR
+) -> memoryview:
+    """Convert, downscale and JPEG-encode an already opened image (zero-copy view of the JPEG)."""
+    # Let libjpeg DCT-scale by 1/2, 1/4 or 1/8 while decoding (no-op for other formats)
+    img.draft('RGB', max_size)
+    
+    # Convert to RGB if necessary (handles PNG with transparency)
+    if img.mode not in ('RGB', 'L'):
+        img = img.convert('RGB')
+    
+    # Calculate new size maintaining aspect ratio
+    img.thumbnail(max_size, resample)
+    
+    # Save to bytes; hand out a view of the buffer instead of copying it with getvalue()
+    buffer = io.BytesIO()
+    img.save(buffer, format='JPEG', quality=85, optimize=True)
+    
+    return buffer.getbuffer()
+
+
+def _resize_buffer(
+    image: Union[str, BinaryIO],
+    max_size: Tuple[int, int],
+    resample: Image.Resampling = Image.Resampling.BILINEAR
+) -> memoryview:
+    """Open and resize an image, returning a view of the JPEG for callers that accept buffers."""
+    try:
+        with Image.open(image) as img:
+            return _resize_opened(img, max_size, resample)
+            
+    except Exception as e:
+        raise ValueError(f"Failed to resize image {image}: {e}")
+
+
+def resize_image_for_api(
+    image_path: Union[str, BinaryIO],
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION),
+    resample: Image.Resampling = Image.Resampling.BILINEAR
+) -> bytes:
     """
     Resize large images to reduce API costs while maintaining quality.
     
     Args:
-        image_path: Path to the image file
+        image_path: Path to the image file, or a binary file-like object
         max_size: Maximum dimensions (width, height)
+        resample: Resampling filter; BILINEAR is plenty for vision models,
+            pass Image.Resampling.LANCZOS for print-quality output
         
     Returns:
         Resized image as bytes
         
+    Raises:
+        ValueError: If image cannot be processed
+    """
+    return _resize_buffer(image_path, max_size, resample).tobytes()
+
+
+def _encode_raw(
+    image_path: str,
+    resize: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION)
+) -> bytes:
+    """Read (and optionally resize) an image file and return its base64 encoding as bytes."""
+    if resize:
+        image_bytes = _resize_buffer(image_path, max_size)
+    else:
+        with open(image_path, 'rb') as f:
+            image_bytes = f.read()
+    
+    return _b64encode(image_bytes)
+
+
+@functools.lru_cache(maxsize=ENCODE_CACHE_SIZE)
+def _cached_encode(
+    image_path: str,
+    mtime_ns: int,
+    size: int,
+    resize: bool,
+    max_size: Tuple[int, int]
+) -> bytes:
+    """Memoized _encode_raw; mtime_ns and size are part of the key so edited files are re-encoded."""
+    return _encode_raw(image_path, resize, max_size)
+
+
+def _encode_path(
+    image_path: str,
+    resize: bool,
+    max_size: Tuple[int, int]
+) -> bytes:
+    """Encode a file through the LRU cache, keyed on a single stat of the file."""
+    st = os.stat(image_path)
+    return _cached_encode(image_path, st.st_mtime_ns, st.st_size, resize, tuple(max_size))
+
+
+def encode_image_to_base64(
+    image_path: str,
+    resize: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION)
+) -> str:
+    """
+    Convert image to base64 string for API calls.
+    
+    Args:
+        image_path: Path to the image file
+        resize: Whether to resize before encoding
+        max_size: Maximum dimensions (width, height) when resizing
+        
+    Returns:
+        Base64 encoded string
+        
     Raises:
         ValueError: If image cannot be processed
     """
     try:
-        with Image.open(image_path) as img:
-            # Convert to RGB if necessary (handles PNG with transparency)
-            if img.mode not in ('RGB', 'L'):
-                img = img.convert('RGB')
-            
-            # Calculate new size maintaining aspect ratio
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
-            
-            # Save to bytes
-            buffer = io.BytesIO()
-            img.save(buffer, format='JPEG', quality=85, optimize=True)
-            buffer.seek(0)
-            
-            return buffer.getvalue()
-            
+        return _encode_path(image_path, resize, max_size).decode('ascii')
+        
     except Exception as e:
-        raise ValueError(f"Failed to resize image {image_path}: {e}")
+        raise ValueError(f"Failed to encode image {image_path}: {e}")
 
 
-def encode_image_to_base64(image_path: str, resize: bool = True) -> str:
+def encode_image_to_base64_bytes(
+    image_path: str,
+    resize: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION)
+) -> bytes:
     """
-    Convert image to base64 string for API calls.
+    Convert image to base64 bytes, for consumers that accept bytes bodies.
+    
+    Skips the bytes-to-str decode of encode_image_to_base64.
     
     Args:
         image_path: Path to the image file
         resize: Whether to resize before encoding
+        max_size: Maximum dimensions (width, height) when resizing
+        
+    Returns:
+        Base64 encoded bytes (ASCII)
+        
+    Raises:
+        ValueError: If image cannot be processed
+    """
+    try:
+        return _encode_path(image_path, resize, max_size)
+        
+    except Exception as e:
+        raise ValueError(f"Failed to encode image {image_path}: {e}")
+
+
+def encode_image_bytes_to_base64(
+    image_bytes: bytes,
+    resize: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION)
+) -> str:
+    """
+    Convert in-memory image contents to a base64 string for API calls.
+    
+    Args:
+        image_bytes: Raw image file contents
+        resize: Whether to resize before encoding
+        max_size: Maximum dimensions (width, height) when resizing
         
     Returns:
         Base64 encoded string
@@ -106,16 +360,35 @@ def encode_image_to_base64(image_path: str, resize: bool = True) -> str:
     """
     try:
         if resize:
-            image_bytes = resize_image_for_api(image_path)
-        else:
-            with open(image_path, 'rb') as f:
-                image_bytes = f.read()
+            image_bytes = _resize_buffer(io.BytesIO(image_bytes), max_size)
         
-        encoded = base64.b64encode(image_bytes).decode('utf-8')
-        return encoded
+        return _b64encode(image_bytes).decode('ascii')
         
     except Exception as e:
-        raise ValueError(f"Failed to encode image {image_path}: {e}")
+        raise ValueError(f"Failed to encode image bytes: {e}")
+
+
+def decode_image_from_base64(data: Union[str, bytes]) -> bytes:
+    """
+    Decode a base64 image payload back to raw image file contents.
+    
+    Malformed payloads are rejected by the base64 decode itself, before they
+    reach PIL; pass the result to validate_image_bytes to check the image.
+    
+    Args:
+        data: Base64 encoded image (str or ASCII bytes), without a data URL prefix
+        
+    Returns:
+        Raw image file contents
+        
+    Raises:
+        ValueError: If data is not valid base64
+    """
+    try:
+        return _b64decode(data)
+        
+    except Exception as e:
+        raise ValueError(f"Invalid base64 image data: {e}")
 
 
 def get_image_info(image_path: str) -> Dict[str, any]:
@@ -129,6 +402,7 @@ def get_image_info(image_path: str) -> Dict[str, any]:
         Dictionary with image information
     """
     try:
+        # Header-only parse; the size comes from the already open descriptor
         with Image.open(image_path) as img:
             return {
                 'path': image_path,
@@ -137,7 +411,7 @@ def get_image_info(image_path: str) -> Dict[str, any]:
                 'size': img.size,
                 'width': img.width,
                 'height': img.height,
-                'file_size_mb': os.path.getsize(image_path) / (1024 * 1024)
+                'file_size_mb': os.fstat(img.fp.fileno()).st_size / (1024 * 1024)
             }
     except Exception as e:
         return {
@@ -146,49 +420,260 @@ def get_image_info(image_path: str) -> Dict[str, any]:
         }
 
 
-def process_multiple_images(image_paths: List[str], validate: bool = True) -> List[Dict[str, any]]:
+def _cv2_resize_encode(image_path: str, max_size: Tuple[int, int]):
     """
-    Batch process multiple pet images.
+    Decode, downscale and JPEG-encode a file with OpenCV.
     
     Args:
-        image_paths: List of image file paths
-        validate: Whether to validate images before processing
+        image_path: Path to the image file
+        max_size: Maximum dimensions (width, height)
         
     Returns:
-        List of dictionaries with processed image data and metadata
+        Encoded JPEG as a uint8 array (buffer protocol), or None if OpenCV cannot read the file
     """
-    results = []
+    arr = cv2.imread(image_path, cv2.IMREAD_COLOR)
+    if arr is None:
+        return None
     
-    for image_path in image_paths:
-        result = {
-            'path': image_path,
-            'valid': False,
-            'base64': None,
-            'info': None,
-            'error': None
-        }
+    # Same geometry as Image.thumbnail: keep aspect ratio, never upscale
+    height, width = arr.shape[:2]
+    scale = min(max_size[0] / width, max_size[1] / height)
+    if scale < 1:
+        new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        arr = cv2.resize(arr, new_size, interpolation=cv2.INTER_AREA)
+    
+    ok, encoded = cv2.imencode('.jpg', arr, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    if not ok:
+        raise ValueError(f"Failed to encode image {image_path} with OpenCV")
+    return encoded
+
+
+def _load_and_process(
+    source: Union[str, bytes],
+    validate: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION),
+    backend: str = 'pil'
+) -> Dict[str, any]:
+    """
+    Validate, inspect and encode one image with a single open.
+    
+    Header checks, metadata and the resize/encode all use the same Image
+    object, so the file is parsed once instead of once per step. Corrupt
+    image data surfaces as an error from the decode itself.
+    
+    Args:
+        source: Image file path, or raw image file contents
+        validate: Whether to validate the image before processing
+        max_size: Maximum dimensions (width, height) for the encoded image
+        backend: 'cv2' decodes/resizes/encodes files with OpenCV when it is
+            installed; alpha and palette images always use Pillow
         
-        try:
-            # Validate if requested
-            if validate:
-                if not validate_image_format(image_path):
-                    result['error'] = 'Validation failed'
-                    results.append(result)
-                    continue
-            
-            # Get image info
-            result['info'] = get_image_info(image_path)
+    Returns:
+        Dictionary with processed image data and metadata
+    """
+    is_path = isinstance(source, str)
+    result = {
+        'path': source if is_path else None,
+        'valid': False,
+        'base64': None,
+        'info': None,
+        'error': None
+    }
+    
+    try:
+        # Cheap checks first: existence, extension and size need no image decoding
+        if is_path:
+            st = _check_path(source) if validate else os.stat(source)
+            if st is None:
+                result['error'] = 'Validation failed'
+                return result
+            file_size_mb = st.st_size / (1024 * 1024)
+        else:
+            file_size_mb = len(source) / (1024 * 1024)
+        
+        if validate and file_size_mb > MAX_IMAGE_SIZE_MB:
+            log.debug("%s too large: %.2fMB (max: %sMB)", 'File' if is_path else 'Image', file_size_mb, MAX_IMAGE_SIZE_MB)
+            result['error'] = 'Validation failed'
+            return result
+        
+        with Image.open(source if is_path else io.BytesIO(source)) as img:
+            if validate and not is_path and img.format not in SUPPORTED_PIL_FORMATS:
+                log.debug("Unsupported format: %s. Supported: %s", img.format, _SUPPORTED_PIL_FORMATS_TEXT)
+                result['error'] = 'Validation failed'
+                return result
             
-            # Encode image
-            result['base64'] = encode_image_to_base64(image_path, resize=True)
-            result['valid'] = True
+            # Get image info (header only)
+            info = {'path': source} if is_path else {}
+            info.update({
+                'format': img.format,
+                'mode': img.mode,
+                'size': img.size,
+                'width': img.width,
+                'height': img.height,
+                'file_size_mb': file_size_mb
+            })
+            result['info'] = info
             
-        except Exception as e:
-            result['error'] = str(e)
+            # Decode, resize and encode the same image
+            encoded = None
+            if backend == 'cv2' and cv2 is not None and is_path and img.mode in ('RGB', 'L'):
+                encoded = _cv2_resize_encode(source, max_size)
+            if encoded is None:
+                encoded = _resize_opened(img, max_size)
+            result['base64'] = _b64encode(encoded).decode('ascii')
+        
+        result['valid'] = True
         
-        results.append(result)
+    except Exception as e:
+        result['error'] = str(e)
+    
+    return result
+
+
+def process_single_image(
+    image_path: str,
+    validate: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION),
+    backend: str = 'pil'
+) -> Dict[str, any]:
+    """
+    Validate, inspect and encode one pet image.
+    
+    Args:
+        image_path: Image file path
+        validate: Whether to validate the image before processing
+        max_size: Maximum dimensions (width, height) for the encoded image
+        backend: 'pil', or 'cv2' to use OpenCV when installed (falls back to Pillow)
+        
+    Returns:
+        Dictionary with processed image data and metadata
+    """
+    return _load_and_process(image_path, validate, max_size, backend)
+
+
+def process_single_image_bytes(
+    image_bytes: bytes,
+    validate: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION)
+) -> Dict[str, any]:
+    """
+    Validate, inspect and encode one in-memory pet image.
+    
+    Args:
+        image_bytes: Raw image file contents
+        validate: Whether to validate the image before processing
+        max_size: Maximum dimensions (width, height) for the encoded image
+        
+    Returns:
+        Dictionary with processed image data and metadata
+    """
+    # Uploads have no path or mtime, so identical re-submissions are
+    # recognized by a digest of their contents
+    key = f"{hashlib.blake2b(image_bytes).hexdigest()}:{validate}:{tuple(max_size)}"
+    result = _bytes_results.get(key)
+    if result is None:
+        result = _load_and_process(image_bytes, validate, max_size)
+        if not result['valid']:
+            return result
+        _bytes_results.set(key, result)
+    
+    # Callers get their own dicts; the cached entry stays untouched
+    return {**result, 'info': dict(result['info'])}
+
+
+def _map_images(
+    process_one,
+    items: List,
+    validate: bool,
+    max_size: Tuple[int, int],
+    workers: Optional[int] = None,
+    use_processes: bool = False,
+    **options
+) -> List[Dict[str, any]]:
+    """
+    Apply a single-image processor to every item, preserving order.
+    
+    Batches run on a thread pool by default. Each task runs the whole per-image
+    pipeline (open -> decode/resize -> JPEG encode -> base64), and file I/O,
+    libjpeg, Pillow's resampling and pybase64's kernel all release the GIL, so
+    every stage of different images overlaps. The binascii fallback holds the
+    GIL, so without pybase64 the base64 stage is serialized. With
+    use_processes, a process pool also parallelizes the pure-Python parts of
+    Pillow; inputs and results are plain picklable values.
+    """
+    process = functools.partial(process_one, validate=validate, max_size=max_size, **options)
+    if len(items) <= 1:
+        return [process(item) for item in items]
+    
+    if use_processes:
+        workers = min(workers or os.cpu_count() or 1, len(items))
+        # A few chunks per worker keeps IPC overhead low while balancing load
+        chunksize = max(1, len(items) // (workers * 4))
+        with multiprocessing.Pool(workers) as pool:
+            return list(pool.imap(process, items, chunksize))
     
-    return results
+    with ThreadPoolExecutor(max_workers=min(workers or MAX_WORKERS, len(items))) as pool:
+        return list(pool.map(process, items))
+
+
+def process_multiple_images(
+    image_paths: List[str],
+    validate: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION),
+    workers: Optional[int] = None,
+    use_processes: bool = False,
+    backend: str = 'pil'
+) -> List[Dict[str, any]]:
+    """
+    Batch process multiple pet images in parallel.
+    
+    Args:
+        image_paths: List of image file paths
+        validate: Whether to validate images before processing
+        max_size: Maximum dimensions (width, height) for the encoded images
+        workers: Number of parallel workers (defaults to a CPU-based limit)
+        use_processes: Use a process pool instead of threads, for large CPU-bound batches
+        backend: 'pil', or 'cv2' to decode/resize/encode with OpenCV when installed
+            (SIMD resize, no per-image Pillow overhead); falls back to Pillow otherwise
+        
+    Returns:
+        List of dictionaries with processed image data and metadata (same order as image_paths)
+        
+    Raises:
+        ValueError: If backend is not one of IMAGE_BACKENDS
+    """
+    if backend not in IMAGE_BACKENDS:
+        raise ValueError(f"Unknown image backend: {backend}. Supported: {IMAGE_BACKENDS}")
+    
+    return _map_images(
+        process_single_image, image_paths, validate, max_size, workers, use_processes,
+        backend=backend
+    )
+
+
+def process_image_bytes(
+    images: List[bytes],
+    validate: bool = True,
+    max_size: Tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION),
+    workers: Optional[int] = None,
+    use_processes: bool = False
+) -> List[Dict[str, any]]:
+    """
+    Batch process in-memory pet images.
+    
+    Same output shape as process_multiple_images, without touching the filesystem.
+    
+    Args:
+        images: List of raw image file contents
+        validate: Whether to validate images before processing
+        max_size: Maximum dimensions (width, height) for the encoded images
+        workers: Number of parallel workers (defaults to a CPU-based limit)
+        use_processes: Use a process pool instead of threads, for large CPU-bound batches
+        
+    Returns:
+        List of dictionaries with processed image data and metadata
+    """
+    return _map_images(process_single_image_bytes, images, validate, max_size, workers, use_processes)
 
 
 def create_placeholder_image(text: str, size: Tuple[int, int] = (400, 400)) -> bytes:
@@ -203,34 +688,38 @@ def create_placeholder_image(text: str, size: Tuple[int, int] = (400, 400)) -> b
         Image as bytes
     """
     try:
-        from PIL import ImageDraw, ImageFont
-        
         # Create image
         img = Image.new('RGB', size, color='lightgray')
         draw = ImageDraw.Draw(img)
         
         # Add text
         text_position = (size[0] // 4, size[1] // 2)
-        draw.text(text_position, text, fill='black')
+        draw.text(text_position, text, fill='black', font=_DEFAULT_FONT)
         
         # Convert to bytes
         buffer = io.BytesIO()
         img.save(buffer, format='JPEG')
-        buffer.seek(0)
         
         return buffer.getvalue()
         
     except Exception as e:
-        print(f"Failed to create placeholder: {e}")
+        log.warning("Failed to create placeholder: %s", e)
         return b''
 
 
 # Export main functions
 __all__ = [
     'validate_image_format',
+    'validate_image_bytes',
     'resize_image_for_api',
     'encode_image_to_base64',
+    'encode_image_to_base64_bytes',
+    'encode_image_bytes_to_base64',
+    'decode_image_from_base64',
     'get_image_info',
+    'process_single_image',
+    'process_single_image_bytes',
     'process_multiple_images',
+    'process_image_bytes',
     'create_placeholder_image'
 ]
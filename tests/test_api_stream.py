@@ -0,0 +1,84 @@
+"""
+Tests for the Server-Sent Events report endpoints, without calling OpenAI.
+"""
+
+import sys
+import os
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.api.main as api
+from src.models.pet_models import PetDescription
+from src.agents.similarity_agent import MatchSimilarityAgent
+from src.agents.decision_agent import DecisionExplanationAgent
+
+
+FORM = {
+    "province": "San José",
+    "canton": "Escazú",
+    "district": "San Rafael",
+    "description": "White and brown dog with a black spot on the left ear",
+}
+
+
+class _FakeExtractor:
+    """Stands in for agent 1 so no vision call is made."""
+
+    async def process(self, user_input):
+        return PetDescription(
+            species="dog",
+            size="medium",
+            colors=["white", "brown"],
+            distinctive_features=["black spot on left ear"],
+            last_seen_location=user_input.location
+        )
+
+
+class _FailingExtractor:
+    async def process(self, user_input):
+        raise RuntimeError("extraction failed")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    agent3 = DecisionExplanationAgent(api_key="test")
+    monkeypatch.setattr(agent3, "generate_explanation", agent3._generate_fallback_explanation)
+    agents = (_FakeExtractor(), MatchSimilarityAgent(api_key=None, use_embeddings=False), agent3)
+    monkeypatch.setattr(api, "agents", agents)
+    return TestClient(api.app)
+
+
+def _events(response):
+    return [orjson.loads(chunk[len("data: "):]) for chunk in response.text.split("\n\n") if chunk]
+
+
+def test_stream_emits_events_in_pipeline_order(client):
+    response = client.post("/api/v1/report/sighting/stream", data=FORM)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _events(response)
+    assert [e["event"] for e in events] == ["extraction", "matches", "final"]
+    assert events[0]["data"]["species"] == "dog"
+    assert events[2]["data"]["matches"] == events[1]["data"]
+
+
+def test_stream_reports_agent_failure_as_error_event(client, monkeypatch):
+    monkeypatch.setattr(api, "agents", (_FailingExtractor(),) + api.agents[1:])
+    response = client.post("/api/v1/report/lost/stream", data=FORM)
+
+    events = _events(response)
+    assert [e["event"] for e in events] == ["error"]
+    assert "extraction failed" in events[0]["detail"]
+
+
+def test_stream_requires_initialized_agents(monkeypatch):
+    monkeypatch.setattr(api, "agents", None)
+    response = TestClient(api.app).post("/api/v1/report/lost/stream", data=FORM)
+    assert response.status_code == 503
@@ -0,0 +1,86 @@
+"""
+Tests for the LLM response cache, the embedding cache and their shared store.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils._cache_store import CacheStore
+from src.utils import _embedding_cache as embedding_cache
+from src.agents import _llm_cache as llm_cache
+
+
+def test_store_opens_directory_lazily(tmp_path):
+    """Creating a store touches nothing; the first write creates the cache."""
+    directory = tmp_path / "cache"
+    store = CacheStore(str(directory))
+    assert not directory.exists()
+
+    assert store.get("missing") is None
+    store.set("key", {"a": 1})
+    assert directory.exists()
+    assert store.get("key") == {"a": 1}
+
+    # A new store on the same directory sees persisted entries
+    assert CacheStore(str(directory)).get("key") == {"a": 1}
+
+
+def test_store_falls_back_to_memory_when_directory_unusable(tmp_path):
+    """A directory that cannot be created degrades to memory instead of raising."""
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    store = CacheStore(str(blocker / "cache"))
+
+    store.set("key", 42)
+    assert store.get("key") == 42
+    assert store._disk is None
+
+
+def test_memory_store_is_bounded_lru():
+    store = CacheStore(None, memory_max_entries=3)
+    for i in range(3):
+        store.set(str(i), i)
+    store.get("0")          # refresh: "1" is now least recently used
+    store.set("3", 3)
+
+    assert store.get("1") is None
+    assert [store.get(k) for k in ("0", "2", "3")] == [0, 2, 3]
+    assert len(store._memory) == 3
+
+
+def test_memory_store_expires_entries():
+    store = CacheStore(None)
+    store.set("old", 1, expire=-1)
+    store.set("new", 2, expire=60)
+    assert store.get("old") is None
+    assert store.get("new") == 2
+
+
+def test_llm_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache, "_store", CacheStore(str(tmp_path / "llm")))
+    assert llm_cache.get("prompt-hash") is None
+    llm_cache.set("prompt-hash", {"species": "dog"})
+    assert llm_cache.get("prompt-hash") == {"species": "dog"}
+
+
+def test_embedding_cache_keys_on_model_and_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_cache, "_store", CacheStore(str(tmp_path / "emb")))
+    embedding_cache.set("model-a", "white dog", [0.1, 0.2])
+
+    assert embedding_cache.get("model-a", "white dog") == [0.1, 0.2]
+    assert embedding_cache.get("model-b", "white dog") is None
+    assert embedding_cache.get("model-a", "black dog") is None
+    assert embedding_cache.make_key("m", "t") != embedding_cache.make_key("m", "t ")
+
+
+def test_importing_caches_creates_nothing(tmp_path, monkeypatch):
+    """Module import must not create cache directories in the working directory."""
+    import importlib
+
+    monkeypatch.chdir(tmp_path)
+    importlib.reload(llm_cache)
+    importlib.reload(embedding_cache)
+    assert list(tmp_path.iterdir()) == []
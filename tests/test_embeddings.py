@@ -0,0 +1,116 @@
+"""
+Tests for batch embedding creation against a fake OpenAI client.
+"""
+
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils._cache_store import CacheStore
+from src.utils import _embedding_cache as embedding_cache
+from src.utils.embedding_utils import batch_create_embeddings, batch_create_embeddings_async
+
+
+MODEL = "text-embedding-3-small"
+
+
+def _embedding(text):
+    """Deterministic fake embedding derived from the text."""
+    return [float(len(text)), float(sum(map(ord, text)))]
+
+
+class _FakeEmbeddings:
+    """Records the inputs of each embeddings.create call."""
+
+    def __init__(self):
+        self.inputs = []
+
+    def create(self, model, input):
+        self.inputs.append(list(input))
+        return SimpleNamespace(data=[SimpleNamespace(embedding=_embedding(t)) for t in input])
+
+
+class _FakeAsyncEmbeddings(_FakeEmbeddings):
+    """Async variant that also tracks how many requests are in flight."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, model, input):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return super().create(model, input)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(embedding_cache, "_store", CacheStore(None))
+
+
+@pytest.fixture
+def client():
+    return SimpleNamespace(embeddings=_FakeEmbeddings())
+
+
+def test_batch_merges_cache_hits_and_misses(client):
+    embedding_cache.set(MODEL, "b", [9.0, 9.0])
+    texts = ["a", "b", "c", "b"]
+
+    embeddings = batch_create_embeddings(texts, model=MODEL, client=client)
+
+    assert embeddings == [_embedding("a"), [9.0, 9.0], _embedding("c"), [9.0, 9.0]]
+    assert client.embeddings.inputs == [["a", "c"]]
+    # Misses are stored for the next call
+    assert embedding_cache.get(MODEL, "c") == _embedding("c")
+    assert batch_create_embeddings(texts, model=MODEL, client=client) == embeddings
+    assert len(client.embeddings.inputs) == 1
+
+
+def test_batch_cache_is_per_model(client):
+    batch_create_embeddings(["a"], model=MODEL, client=client)
+    batch_create_embeddings(["a"], model="text-embedding-3-large", client=client)
+    assert client.embeddings.inputs == [["a"], ["a"]]
+
+
+def test_batch_splits_misses_into_chunks(client):
+    texts = [f"text {i}" for i in range(5)]
+    embeddings = batch_create_embeddings(texts, model=MODEL, chunk_size=2, client=client)
+
+    assert embeddings == [_embedding(t) for t in texts]
+    assert client.embeddings.inputs == [texts[0:2], texts[2:4], texts[4:5]]
+
+
+def test_async_batch_chunks_concurrently_and_merges_cache_hits():
+    texts = [f"text {i}" for i in range(7)]
+    embedding_cache.set(MODEL, texts[3], [9.0, 9.0])
+    client = SimpleNamespace(embeddings=_FakeAsyncEmbeddings())
+
+    embeddings = asyncio.run(batch_create_embeddings_async(
+        texts, model=MODEL, chunk_size=2, concurrency=2, client=client
+    ))
+
+    expected = [_embedding(t) for t in texts]
+    expected[3] = [9.0, 9.0]
+    assert embeddings == expected
+    assert sorted(map(len, client.embeddings.inputs)) == [2, 2, 2]
+    assert texts[3] not in sum(client.embeddings.inputs, [])
+    assert client.embeddings.max_in_flight == 2
+
+
+def test_async_batch_all_cached_needs_no_client_or_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    embedding_cache.set(MODEL, "a", [1.0])
+    assert asyncio.run(batch_create_embeddings_async(["a"], model=MODEL)) == [[1.0]]
+
+    with pytest.raises(ValueError):
+        asyncio.run(batch_create_embeddings_async(["b"], model=MODEL))
@@ -0,0 +1,105 @@
+"""
+Tests for image utilities.
+"""
+
+import sys
+import os
+import io
+import base64
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils import image_utils
+from src.utils._cache_store import CacheStore
+from src.utils.image_utils import (
+    decode_image_from_base64,
+    encode_image_to_base64,
+    process_single_image_bytes,
+    validate_image_bytes
+)
+
+
+def _jpeg_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (32, 24), 'red').save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("as_bytes", [False, True])
+def test_decode_image_from_base64_round_trip(as_bytes):
+    raw = _jpeg_bytes()
+    encoded = base64.b64encode(raw)
+    decoded = decode_image_from_base64(encoded if as_bytes else encoded.decode('ascii'))
+
+    assert decoded == raw
+    assert validate_image_bytes(decoded)
+
+
+@pytest.mark.parametrize("data", ["abc$", "a b c d", "QUJD\nRA==", "QUJ", b"\xff\xfe"])
+def test_decode_image_from_base64_rejects_malformed(data):
+    """Invalid characters and bad padding are errors, not silently dropped."""
+    with pytest.raises(ValueError, match="Invalid base64 image data"):
+        decode_image_from_base64(data)
+
+
+@pytest.fixture
+def counted_loads(monkeypatch):
+    """Fresh upload memo, with a counter of the images actually decoded."""
+    monkeypatch.setattr(image_utils, "_bytes_results", CacheStore(None))
+    loads = []
+    original = image_utils._load_and_process
+
+    def load(source, validate, max_size, *args, **kwargs):
+        loads.append(source)
+        return original(source, validate, max_size, *args, **kwargs)
+
+    monkeypatch.setattr(image_utils, "_load_and_process", load)
+    return loads
+
+
+def test_uploads_are_memoized_by_content(counted_loads):
+    data = _jpeg_bytes()
+    first = process_single_image_bytes(data)
+    assert first['valid']
+
+    # Identical contents (a different bytes object) reuse the result
+    second = process_single_image_bytes(bytes(bytearray(data)))
+    assert second == first
+    assert len(counted_loads) == 1
+
+    # A different size limit is a different result
+    process_single_image_bytes(data, max_size=(16, 16))
+    assert len(counted_loads) == 2
+
+
+def test_memoized_upload_results_are_copies(counted_loads):
+    data = _jpeg_bytes()
+    result = process_single_image_bytes(data)
+    result['info']['width'] = -1
+    result['base64'] = None
+
+    again = process_single_image_bytes(data)
+    assert again['info']['width'] == 32
+    assert again['base64']
+
+
+def test_invalid_uploads_are_not_memoized(counted_loads):
+    assert not process_single_image_bytes(b"not an image")['valid']
+    assert not process_single_image_bytes(b"not an image")['valid']
+    assert len(counted_loads) == 2
+
+
+def test_file_encoding_is_refreshed_when_the_file_changes(tmp_path):
+    path = tmp_path / "pet.jpg"
+    path.write_bytes(_jpeg_bytes())
+    first = encode_image_to_base64(str(path))
+    assert encode_image_to_base64(str(path)) == first
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (40, 30), 'blue').save(buffer, 'JPEG')
+    path.write_bytes(buffer.getvalue())
+    assert encode_image_to_base64(str(path)) != first
@@ -0,0 +1,57 @@
+"""
+Tests for agent setup and the pooled OpenAI clients it creates.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.main as pipeline
+from src.main import Config, setup_agents, process_pet_report_once
+from src.models.pet_models import Location, PetDescription, UserInput
+
+
+class _FakeExtractor:
+    """Stands in for agent 1 so no API call is made."""
+
+    async def process(self, user_input):
+        return PetDescription(
+            species="dog",
+            size="medium",
+            colors=["white", "brown"],
+            distinctive_features=["black spot on left ear"],
+            last_seen_location=user_input.location
+        )
+
+
+@pytest.fixture
+def agents(monkeypatch):
+    _, agent2, agent3 = setup_agents(Config(openai_api_key="test", use_embeddings=False))
+    monkeypatch.setattr(agent3, "generate_explanation", agent3._generate_fallback_explanation)
+    return _FakeExtractor(), agent2, agent3
+
+
+def test_setup_agents_shares_one_pool_pair(agents):
+    _, agent2, agent3 = agents
+    assert len(pipeline._shared_http_clients) == 2
+    assert agent3.client is agent2.client
+    asyncio.run(pipeline.close_shared_clients())
+
+
+def test_one_shot_runs_close_their_pools(agents):
+    http_clients = list(pipeline._shared_http_clients)
+    user_input = UserInput(
+        description="White and brown dog with a black spot on the left ear",
+        location=Location(province="San José", canton="Escazú", district="San Rafael")
+    )
+
+    result = asyncio.run(process_pet_report_once(user_input, *agents))
+
+    assert result.matches is not None
+    assert pipeline._shared_http_clients == []
+    assert all(client.is_closed for client in http_clients)
@@ -0,0 +1,63 @@
+"""
+Tests for report date handling in the mock database and Agent 2.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.pet_models import Location, PetDescription, PetReport
+from src.utils.data_access import MockDatabase
+from src.agents.similarity_agent import MatchSimilarityAgent
+
+
+PET = PetDescription(
+    species="dog",
+    size="medium",
+    colors=["white", "brown"],
+    distinctive_features=["black spot on left ear"],
+    last_seen_location=Location(province="San José", canton="Escazú", district="San Rafael")
+)
+
+
+def _date_strings(days_ago):
+    """The same instant written as naive local time, UTC with Z, and with an offset."""
+    moment = datetime.now(timezone.utc) - timedelta(days=days_ago, hours=1)
+    return [
+        moment.astimezone().replace(tzinfo=None).isoformat(),
+        moment.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        moment.astimezone(timezone(timedelta(hours=-6))).isoformat(),
+    ]
+
+
+@pytest.mark.parametrize("date_str", _date_strings(10))
+def test_days_since_accepts_naive_and_aware_dates(date_str):
+    db = MockDatabase()
+    assert db.calculate_days_since(date_str) == 10
+    assert db.calculate_days_since(date_str, datetime.now()) == 10
+
+
+def test_days_since_invalid_date_is_zero():
+    assert MockDatabase().calculate_days_since("not a date") == 0
+
+
+@pytest.mark.parametrize("date_str", _date_strings(3))
+def test_agent2_reports_days_since_for_aware_dates(date_str, monkeypatch):
+    """Agent 2 passes a naive now to every candidate; aware dates must still count."""
+    report = PetReport(
+        report_id="LOST-TZ",
+        report_type="lost",
+        pet_description=PET,
+        raw_description="White and brown dog",
+        report_date=date_str
+    )
+    agent = MatchSimilarityAgent(api_key=None, use_embeddings=False)
+    monkeypatch.setattr(agent, "search_with_mock", lambda pet: [(report, 0.9)])
+
+    result = agent.process(PET)
+    assert [c.days_since_report for c in result.candidates] == [3]
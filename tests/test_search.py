@@ -0,0 +1,87 @@
+"""
+Tests for the vectorized mock-database search index.
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.pet_models import Location, PetDescription
+from src.utils.data_access import MockDatabase, _SearchIndex
+
+
+@pytest.fixture(scope="module")
+def db():
+    return MockDatabase()
+
+
+def _queries(db):
+    """Every stored description plus one with out-of-vocabulary terms and location."""
+    reports = db.get_all_lost_pets() + db.get_all_sightings()
+    queries = [r.pet_description for r in reports]
+    queries.append(PetDescription(
+        species="cat",
+        size="small",
+        colors=["Purple", "white"],
+        distinctive_features=["Green eyes", "never seen before"],
+        last_seen_location=Location(province="Limón", canton="X", district="Y")
+    ))
+    return queries
+
+
+def test_search_index_matches_scalar_similarity(db):
+    """Bitset/NumPy scores equal the reference pairwise scorer for every report."""
+    reports = db.get_all_lost_pets() + db.get_all_sightings()
+    index = _SearchIndex(reports)
+
+    for query in _queries(db):
+        expected = [db._calculate_similarity(query, r.pet_description) for r in reports]
+        np.testing.assert_allclose(index.score(query), expected, rtol=0, atol=1e-12)
+
+
+def test_search_index_many_terms_span_several_words():
+    """Vocabularies over 64 terms use more than one uint64 word per row."""
+    location = Location(province="Heredia", canton="Barva", district="San Pedro")
+    pets = [
+        PetDescription(
+            species="dog",
+            size="medium",
+            colors=[f"color{i}", f"color{i + 1}"],
+            distinctive_features=[f"feature{j}" for j in range(i, i + 40)],
+            last_seen_location=location
+        )
+        for i in range(0, 100, 10)
+    ]
+
+    class _Report:
+        def __init__(self, pet):
+            self.pet_description = pet
+            self.report_type = 'lost'
+
+    index = _SearchIndex([_Report(p) for p in pets])
+    assert index.features_bitset.shape[1] > 1
+
+    db = MockDatabase()
+    for query in pets:
+        expected = [db._calculate_similarity(query, p) for p in pets]
+        np.testing.assert_allclose(index.score(query), expected, rtol=0, atol=1e-12)
+
+
+def test_search_similar_pets_ranking(db):
+    """Results are sorted by score and filtered by report type."""
+    query = db.get_all_lost_pets()[0].pet_description
+
+    results = db.search_similar_pets(query, top_k=5)
+    scores = [score for _, score in results]
+    assert len(results) == 5
+    assert scores == sorted(scores, reverse=True)
+    assert results[0][0].report_id == db.get_all_lost_pets()[0].report_id
+
+    sightings = db.search_similar_pets(query, top_k=100, report_type='sighting')
+    assert sightings and all(r.report_type == 'sighting' for r, _ in sightings)
+    assert db.search_similar_pets(query, top_k=0) == []
@@ -0,0 +1,55 @@
+"""
+Tests for UserInput with in-memory image contents.
+"""
+
+import sys
+import os
+import io
+
+import pytest
+from PIL import Image
+from pydantic import ValidationError
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.pet_models import Location, UserInput
+
+
+LOCATION = Location(province="San José", canton="Escazú", district="San Rafael")
+DESCRIPTION = "White and brown dog with a black spot"
+
+
+def _jpeg_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (32, 24), 'red').save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+def test_from_bytes_keeps_images_in_memory():
+    user_input = UserInput.from_bytes([_jpeg_bytes()] * 2, location=LOCATION, description=DESCRIPTION)
+    assert user_input.images == []
+    assert len(user_input.image_bytes) == 2
+    assert user_input.image_count == 2
+    # Raw contents are not serialized
+    assert 'image_bytes' not in user_input.model_dump()
+
+
+def test_total_images_limit_counts_paths_and_bytes():
+    UserInput(
+        images=["a.jpg", "b.jpg"],
+        image_bytes=[b"x"] * 3,
+        location=LOCATION,
+        description=DESCRIPTION
+    )
+
+    with pytest.raises(ValidationError, match="Maximum 5 images allowed"):
+        UserInput(
+            images=["a.jpg", "b.jpg", "c.jpg"],
+            image_bytes=[b"x"] * 3,
+            location=LOCATION,
+            description=DESCRIPTION
+        )
+
+    with pytest.raises(ValidationError):
+        UserInput.from_bytes([b"x"] * 6, location=LOCATION, description=DESCRIPTION)
@@ -0,0 +1,60 @@
+"""
+Tests for the int8-quantized in-memory vector store.
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.embedding_utils import QuantizedVectorStore, search_vector_store_quantized
+
+
+def test_quantized_store_approximates_cosine():
+    """int8 scores stay close to float cosine similarity."""
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 64)).astype(np.float32)
+    query = rng.normal(size=64).astype(np.float32)
+
+    store = QuantizedVectorStore()
+    store.add([f"id{i}" for i in range(50)], vectors.tolist())
+    assert len(store) == 50
+
+    exact = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    np.testing.assert_allclose(store.scores(query), exact, atol=0.02)
+
+
+def test_quantized_store_search_and_filter():
+    """Search returns the closest ids first and honours metadata filters."""
+    store = QuantizedVectorStore()
+    store.add(
+        ["dog-a", "dog-b", "cat-a"],
+        [[1.0, 0.0, 0.0], [0.6, 0.8, 0.0], [0.99, 0.1, 0.0]],
+        [{"species": "dog"}, {"species": "dog"}, {"species": "cat"}]
+    )
+
+    results = search_vector_store_quantized(store, [1.0, 0.0, 0.0], top_k=2)
+    assert [r['id'] for r in results] == ["dog-a", "cat-a"]
+    assert results[0]['distance'] == pytest.approx(0.0, abs=0.01)
+
+    dogs = search_vector_store_quantized(store, [1.0, 0.0, 0.0], filter_metadata={"species": "dog"})
+    assert [r['id'] for r in dogs] == ["dog-a", "dog-b"]
+
+    # Zero vectors are stored but score 0
+    store.add(["zero"], [[0.0, 0.0, 0.0]])
+    assert store.scores([1.0, 0.0, 0.0])[-1] == 0
+
+
+def test_quantized_store_rejects_mismatched_lengths():
+    store = QuantizedVectorStore()
+    store.add(["a"], [[1.0, 0.0]])
+    with pytest.raises(ValueError):
+        store.add(["b"], [[1.0, 0.0, 0.0]])
+    with pytest.raises(ValueError):
+        store.add(["c", "d"], [[1.0, 0.0]])
+    with pytest.raises(ValueError):
+        store.scores([1.0, 0.0, 0.0])
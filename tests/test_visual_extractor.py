@@ -0,0 +1,160 @@
+"""
+Tests for Agent 1 (Visual & Text Extractor) against a fake OpenAI client.
+"""
+
+import sys
+import os
+import io
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+from PIL import Image
+from tenacity import wait_none
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.pet_models import Location, UserInput
+from src.utils._cache_store import CacheStore
+from src.agents import _llm_cache as llm_cache
+from src.agents import visual_extractor_agent
+from src.agents.visual_extractor_agent import VisualTextExtractorAgent
+
+
+LOCATION = Location(province="San José", canton="Escazú", district="San Rafael")
+DESCRIPTION = "White and brown dog with a black spot on the left ear"
+TEXT_RESULT = '{"species": "dog", "size": "medium", "colors": ["white"], "distinctive_features": []}'
+
+
+def _completion(content=None, refusal=None):
+    message = SimpleNamespace(content=content, refusal=refusal)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _status_error(cls, status):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return cls("error", response=httpx.Response(status, request=request), body=None)
+
+
+class _FakeClient:
+    """Replays a scripted sequence of responses or exceptions from chat.completions.create."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    """Keep cached responses in memory and skip retry backoff sleeps."""
+    monkeypatch.setattr(llm_cache, "_store", CacheStore(None))
+    monkeypatch.setattr(VisualTextExtractorAgent._call_llm.retry, "wait", wait_none())
+
+
+def _agent(client, **kwargs):
+    return VisualTextExtractorAgent(api_key="test", async_client=client, **kwargs)
+
+
+def test_transient_errors_are_retried():
+    client = _FakeClient(
+        _status_error(openai.RateLimitError, 429),
+        _status_error(openai.InternalServerError, 500),
+        _completion(TEXT_RESULT)
+    )
+    result = asyncio.run(_agent(client).analyze_text(DESCRIPTION, LOCATION))
+
+    assert result["species"] == "dog"
+    assert len(client.calls) == 3
+
+
+def test_exhausted_retries_fall_back_to_empty_extraction():
+    client = _FakeClient(*(_status_error(openai.RateLimitError, 429) for _ in range(3)))
+    result = asyncio.run(_agent(client).analyze_text(DESCRIPTION, LOCATION))
+
+    assert result["species"] is None and result["colors"] == []
+    assert len(client.calls) == 3
+
+
+def test_bad_request_is_not_retried():
+    client = _FakeClient(_status_error(openai.BadRequestError, 400))
+    result = asyncio.run(_agent(client).analyze_text(DESCRIPTION, LOCATION))
+
+    assert result["species"] is None
+    assert len(client.calls) == 1
+
+
+@pytest.mark.parametrize("response", [
+    _completion(None, refusal="I can't help with that."),
+    _completion(None)
+])
+def test_refusal_falls_back_to_empty_extraction(response):
+    """Strict structured outputs return content=None on refusal; the report must not fail."""
+    agent = _agent(_FakeClient(response))
+    result = asyncio.run(agent.analyze_text(DESCRIPTION, LOCATION))
+
+    assert result["species"] is None and result["colors"] == []
+    # Refusals are not cached
+    assert llm_cache._store._memory == {}
+
+
+def test_process_survives_refusal():
+    agent = _agent(_FakeClient(_completion(None, refusal="No.")))
+    user_input = UserInput(description=DESCRIPTION, location=LOCATION)
+    pet = asyncio.run(agent.process(user_input))
+
+    assert pet.species.value == "other"
+    assert pet.colors == ["unknown"]
+
+
+def test_cache_key_separates_parts_and_includes_prompt_version(monkeypatch):
+    agent = _agent(_FakeClient())
+    key = agent._cache_key("white dog", "gpt-4o")
+
+    assert key == agent._cache_key("white dog", "gpt-4o")
+    assert key != agent._cache_key("white do", "ggpt-4o")
+    assert key != agent._cache_key("gpt-4o", "white dog")
+
+    monkeypatch.setattr(visual_extractor_agent, "PROMPT_VERSION", "test")
+    assert key != agent._cache_key("white dog", "gpt-4o")
+
+
+def test_text_analysis_is_cached_per_description_location_and_model():
+    client = _FakeClient(*(_completion(TEXT_RESULT) for _ in range(3)))
+    agent = _agent(client)
+
+    first = asyncio.run(agent.analyze_text(DESCRIPTION, LOCATION))
+    assert asyncio.run(agent.analyze_text(DESCRIPTION, LOCATION)) == first
+    assert len(client.calls) == 1
+
+    other_district = Location(province="San José", canton="Escazú", district="San Antonio")
+    asyncio.run(agent.analyze_text(DESCRIPTION, other_district))
+    asyncio.run(_agent(client, text_model="gpt-4o-mini").analyze_text(DESCRIPTION, LOCATION))
+    assert len(client.calls) == 3
+
+
+def test_vision_cache_key_includes_generation_settings():
+    """Results generated with a different token budget or temperature are not reused."""
+    buffer = io.BytesIO()
+    Image.new('RGB', (64, 48), 'white').save(buffer, 'JPEG')
+    images = [buffer.getvalue()]
+
+    client = _FakeClient(*(_completion(TEXT_RESULT) for _ in range(3)))
+    asyncio.run(_agent(client).analyze_images([], images))
+    asyncio.run(_agent(client).analyze_images([], images))
+    assert len(client.calls) == 1
+
+    asyncio.run(_agent(client, vision_max_tokens=800).analyze_images([], images))
+    asyncio.run(_agent(client, vision_temperature=0.0).analyze_images([], images))
+    assert len(client.calls) == 3
+    assert [call["max_tokens"] for call in client.calls] == [500, 800, 500]